@@ -1,47 +1,102 @@
+from functools import lru_cache
+
 from scorum.graphenebase.account import PasswordKey
 
+from automation.keyring import KEYRING
+
+KEYS_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=KEYS_CACHE_SIZE)
+def _password_key(name, password, role):
+    return PasswordKey(name, password, role=role)
+
+
+@lru_cache(maxsize=KEYS_CACHE_SIZE)
+def _key_pair(name, password, role):
+    """
+    :return tuple(str, str): Public and private key, derived once per name, password and role unless they are
+        in keyring.
+    """
+    pair = KEYRING.get(name, password, role)
+    if pair is None:
+        key = _password_key(name, password, role)
+        pair = str(key.get_public()), str(key.get_private())
+        KEYRING.add(name, password, role, *pair)
+    return pair
+
 
 class Account(object):
+    """
+    Keys are derived on first use and shared by all accounts with the same name and password.
+    """
+
     def __init__(self, name, password=None):
         self.name = name
         self._password = password if password else self.name
-
-        self.owner = PasswordKey(self.name, self._password, role='owner')
-        self.active = PasswordKey(self.name, self._password, role='active')
-        self.posting = PasswordKey(self.name, self._password, role='posting')
+        self._key_pairs = {}  # dict(str, tuple(str, str)), keys of this account by role
         self.signing = None
 
     def __eq__(self, other):
         return self.name == other.name
 
+    @property
+    def owner(self):
+        return _password_key(self.name, self._password, 'owner')
+
+    @property
+    def active(self):
+        return _password_key(self.name, self._password, 'active')
+
+    @property
+    def posting(self):
+        return _password_key(self.name, self._password, 'posting')
+
     def get_active_public(self):
-        return str(self.owner.get_public())
-        # return str(self.active.get_public())
+        return self._keys('owner')[0]
+        # return self._keys('active')[0]
 
     def get_active_private(self):
-        return str(self.owner.get_private())
-        # return str(self.active.get_private())
+        return self._keys('owner')[1]
+        # return self._keys('active')[1]
 
     def get_owner_public(self):
-        return str(self.owner.get_public())
+        return self._keys('owner')[0]
 
     def get_owner_private(self):
-        return str(self.owner.get_private())
+        return self._keys('owner')[1]
 
     def get_posting_public(self):
-        return str(self.owner.get_public())
-        # return str(self.posting.get_public())
+        return self._keys('owner')[0]
+        # return self._keys('posting')[0]
 
     def get_posting_private(self):
-        return str(self.owner.get_private())
-        # return str(self.posting.get_private())
+        return self._keys('owner')[1]
+        # return self._keys('posting')[1]
 
     def get_signing_public(self):
-        return str(self.signing.get_public())
+        return self._keys('signing')[0]
 
     def get_signing_private(self):
-        return str(self.signing.get_private())
+        return self._keys('signing')[1]
 
     def set_signing_key(self):
-        self.signing = PasswordKey(self.name, self._password, role='signing')
+        self.signing = _password_key(self.name, self._password, 'signing')
         return self
+
+    def set_keys(self, role, public, private):
+        """
+        Use keys derived in advance, e.g. by `derive_key_pairs`.
+
+        :param str role: 'owner', 'active', 'posting' or 'signing'
+        :param str public:
+        :param str private:
+        """
+        self._key_pairs[role] = (public, private)
+        return self
+
+    def _keys(self, role):
+        pair = self._key_pairs.get(role)
+        if pair is None:
+            pair = self._key_pairs[role] = _key_pair(self.name, self._password, role)
+        return pair
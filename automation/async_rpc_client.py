@@ -0,0 +1,120 @@
+import asyncio
+import copy
+import itertools
+import time
+
+import websockets
+
+from automation.codec import DEFAULT_CODEC
+from automation.rpc_client import is_read_request
+from automation.rpc_stats import STATS
+
+
+class AsyncRpcClient(object):
+    """
+    Asyncio JSON-RPC client which keeps many requests in flight on a single websocket.
+
+    Every request gets a unique id, responses are routed back to the waiting caller by that id,
+    so requests could be pipelined with `asyncio.gather`:
+
+        rpc = AsyncRpcClient()
+        await rpc.open_ws(addr)
+        blocks = await asyncio.gather(*[
+            rpc.send(Wallet.json_rpc_body('get_block', n, api='blockchain_history_api')) for n in range(1, 1000)
+        ])
+        await rpc.close_ws()
+
+    Identical read requests awaited concurrently are sent once, every caller gets its own copy of the response.
+    """
+
+    def __init__(self, max_in_flight=100, codec=DEFAULT_CODEC, coalesce=True):
+        """
+        :param int max_in_flight: Maximum number of requests sent to node without response.
+        :param JsonCodec codec: Codec used to encode requests and decode responses.
+        :param bool coalesce: Share response between identical concurrent read requests.
+        """
+        self.max_in_flight = max_in_flight
+        self.codec = codec
+        self.coalesce = coalesce
+        self._coalesced = {}  # dict(bytes|str, asyncio.Future)
+        self._ws = None
+        self._reader = None
+        self._ids = itertools.count(1)
+        self._pending = {}  # dict(int, asyncio.Future)
+        self._window = None
+
+    async def open_ws(self, addr):
+        self._ws = await websockets.connect("ws://{addr}".format(addr=addr), max_size=None)
+        self._window = asyncio.Semaphore(self.max_in_flight)
+        self._reader = asyncio.ensure_future(self._read_responses())
+
+    async def close_ws(self):
+        if self._reader:
+            self._reader.cancel()
+            self._reader = None
+        if self._ws:
+            await self._ws.close()
+            self._ws = None
+        self._fail_pending(ConnectionError("Websocket connection was closed."))
+
+    async def send(self, json_request):
+        """
+        Send request and wait for its response without blocking other requests.
+
+        :param bytes|str|dict json_request: Request body, e.g. result of `Wallet.json_rpc_body`.
+        :return dict: Response with the same `id` as it was in request.
+        """
+        if not self.coalesce or not isinstance(json_request, (bytes, str)) or not is_read_request(json_request):
+            return await self._send(json_request)
+
+        shared = self._coalesced.get(json_request)
+        if shared is None:
+            shared = self._coalesced[json_request] = asyncio.ensure_future(self._send(json_request))
+            shared.add_done_callback(lambda _: self._coalesced.pop(json_request, None))
+        # shield: cancellation of one caller should not cancel request awaited by others
+        return copy.deepcopy(await asyncio.shield(shared))
+
+    async def _send(self, json_request):
+        if isinstance(json_request, dict):
+            request = dict(json_request)
+        else:
+            request = self.codec.decode(json_request)
+
+        original_id = request.get("id")
+        request["id"] = next(self._ids)
+        future = asyncio.get_event_loop().create_future()
+
+        async with self._window:
+            self._pending[request["id"]] = future
+            try:
+                frame = self.codec.encode(request).decode('utf8')
+                started = time.time()
+                await self._ws.send(frame)
+                response, response_size = await future
+            finally:
+                self._pending.pop(request["id"], None)
+
+        if STATS.enabled:
+            STATS.record(request, time.time() - started, len(frame), response_size, 'error' in response)
+
+        response["id"] = original_id
+        return response
+
+    async def _read_responses(self):
+        try:
+            while True:
+                frame = await self._ws.recv()
+                response = self.codec.decode(frame)
+                future = self._pending.get(response.get("id"))
+                if future and not future.done():
+                    future.set_result((response, len(frame)))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._fail_pending(e)
+
+    def _fail_pending(self, error):
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
@@ -0,0 +1,174 @@
+import json
+import os
+import threading
+import time
+
+from automation.rpc_client import RpcClient
+
+BLOCK_APPLIED_CALLBACK_ID = 0
+
+
+def _request(api, method, args):
+    return json.dumps({"jsonrpc": "2.0", "id": 0, "method": "call", "params": [api, method, args]})
+
+
+class HeadBlockWatcher(object):
+    """
+    Tracks head block of node in background thread and wakes up waiters as soon as new block is applied.
+
+    Watcher subscribes on `database_api.set_block_applied_callback` notifications. If node doesn't provide them,
+    head block is polled on the watcher's own connection, so there is single poller per endpoint regardless of
+    number of waiters. Watcher stops when it has neither waiters nor listeners for `idle_timeout` seconds,
+    `get` starts new one on next use.
+    """
+
+    _watchers = {}  # dict(str, HeadBlockWatcher)
+    _watchers_lock = threading.Lock()
+
+    def __init__(self, endpoint, rpc=None, poll_interval=0.1, notice_timeout=3, connect_timeout=1, idle_timeout=5):
+        """
+        :param str endpoint: Node rpc endpoint, e.g. '127.0.0.1:8090'
+        :param RpcClient rpc: Client which clone is used by watcher, so it has the same transport and codec,
+            e.g. wallet's one. Plain `RpcClient` by default.
+        :param float poll_interval: Number of seconds between head block requests if notifications are unavailable.
+        :param float notice_timeout: Number of seconds to wait for notification before head block is requested.
+        :param float connect_timeout: Number of seconds to wait for connection, watcher stops and wakes up waiters if
+            node is not connected by then, so they could fall back to polling for the rest of their timeout.
+        :param float idle_timeout: Number of seconds watcher keeps running without waiters and listeners.
+        """
+        self.endpoint = endpoint
+        self.poll_interval = poll_interval
+        self.notice_timeout = notice_timeout
+        self.connect_timeout = connect_timeout
+        self.idle_timeout = idle_timeout
+        self.head_block_number = 0
+        self.subscribed = False
+        self.error = None
+        self._alive = True
+        self._pid = os.getpid()
+        self._cond = threading.Condition()
+        self._listeners = []
+        self._waiters = 0
+        self._last_used = time.time()
+        self._rpc = rpc.clone() if rpc else RpcClient()
+        self._rpc.on_notice = self._on_notice
+        self._thread = threading.Thread(target=self._run, name="HeadBlockWatcher(%s)" % endpoint, daemon=True)
+
+    @classmethod
+    def get(cls, endpoint, rpc=None):
+        """
+        Get running watcher for endpoint, start new one if there is no watcher or previous one has stopped.
+
+        :param str endpoint:
+        :param RpcClient rpc: Client which clone is used by new watcher, see `__init__`.
+        :rtype: HeadBlockWatcher
+        """
+        with cls._watchers_lock:
+            watcher = cls._watchers.get(endpoint)
+            if not watcher or not watcher.alive:
+                watcher = cls(endpoint, rpc)
+                watcher._thread.start()
+                cls._watchers[endpoint] = watcher
+            watcher._last_used = time.time()  # returned watcher is not stopped as idle before it is used
+            return watcher
+
+    @property
+    def alive(self):
+        # forked child inherits watcher, but not its thread
+        return self._alive and self._pid == os.getpid()
+
+    def wait(self, num, timeout):
+        """
+        Wait until block with given number is applied.
+
+        :param int num: Number of block to wait for.
+        :param float timeout: Maximum number of seconds to wait.
+        :return bool: True if block was applied, False on timeout or if watcher has stopped.
+        """
+        deadline = time.time() + timeout
+        with self._cond:
+            self._waiters += 1
+            try:
+                while self.head_block_number < num:
+                    remaining = deadline - time.time()
+                    if not self.alive or remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+                return True
+            finally:
+                self._waiters -= 1
+                self._last_used = time.time()
+
+    def stop(self):
+        self._alive = False
+
+    def add_listener(self, listener):
+        """
+        :param callable listener: Called from watcher thread with number of new head block. Numbers are increasing,
+            but some of them could be skipped if notifications are unavailable.
+        """
+        with self._cond:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        with self._cond:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+            self._last_used = time.time()
+
+    def _run(self):
+        try:
+            self._rpc.open_ws(self.endpoint, timeout=self.connect_timeout)
+            self._poll_head_block()
+            self.subscribed = self._subscribe()
+            while self._alive and not self._stop_if_idle():
+                if self.subscribed:
+                    if not self._rpc.poll_notice(self.notice_timeout):
+                        self._poll_head_block()  # in case if notification was lost
+                else:
+                    time.sleep(self.poll_interval)
+                    self._poll_head_block()
+        except Exception as e:
+            self.error = e
+        finally:
+            with self._cond:
+                self._alive = False
+                self._cond.notify_all()
+            self._rpc.close_ws()
+
+    def _stop_if_idle(self):
+        """
+        :return bool: Watcher has stopped, because nobody has used it for `idle_timeout`.
+        """
+        with self._watchers_lock, self._cond:  # `get` doesn't return watcher which is being stopped
+            if self._waiters or self._listeners or time.time() - self._last_used < self.idle_timeout:
+                return False
+            self._alive = False
+            return True
+
+    def _subscribe(self):
+        response = self._rpc.send(
+            _request('database_api', 'set_block_applied_callback', [BLOCK_APPLIED_CALLBACK_ID])
+        )
+        return 'error' not in response
+
+    def _poll_head_block(self):
+        response = self._rpc.send(_request('database_api', 'get_dynamic_global_properties', []))
+        self._set_head_block_number(response['result']['head_block_number'])
+
+    def _on_notice(self, callback_id, args):
+        if callback_id != BLOCK_APPLIED_CALLBACK_ID:
+            return
+        header = args[0] if isinstance(args, list) else args
+        # block number is stored in first 4 bytes of block id, 'previous' is id of preceding block
+        self._set_head_block_number(int(header['previous'][:8], 16) + 1)
+
+    def _set_head_block_number(self, num):
+        with self._cond:
+            if num <= self.head_block_number:
+                return
+            self.head_block_number = num
+            self._cond.notify_all()
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(num)
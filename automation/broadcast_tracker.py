@@ -0,0 +1,188 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from automation.block_watcher import HeadBlockWatcher, _request
+from automation.rpc_client import RpcClient
+
+
+def _error(message):
+    return {"id": 0, "error": {"message": message}}
+
+
+class _Tracked(object):
+    def __init__(self, tx_id, signature, expiration):
+        self.tx_id = tx_id
+        self.signature = signature
+        self.expiration = expiration
+        self.future = Future()
+
+
+class BroadcastTracker(object):
+    """
+    Resolves futures of transactions broadcast without waiting, once they are included in block or expired.
+
+    Tracker follows head block with `HeadBlockWatcher` and reads new blocks on its own connection only while there
+    are pending transactions. Tracker stops when it has no pending transactions for `idle_timeout` seconds, so the
+    watcher could stop too, `get` starts new one on next use. Futures are resolved with the same result `broadcast_transaction_synchronous` returns,
+    e.g. {"id": "...", "block_num": 10, "trx_num": 0, "expired": False}, or with error response.
+    """
+
+    _trackers = {}  # dict(str, BroadcastTracker)
+    _trackers_lock = threading.Lock()
+
+    def __init__(self, endpoint, rpc=None, timeout=3, idle_timeout=5):
+        """
+        :param str endpoint: Node rpc endpoint, e.g. '127.0.0.1:8090'
+        :param RpcClient rpc: Client which clone is used by tracker and its head block watcher, so they have the same
+            transport and codec, e.g. wallet's one. Plain `RpcClient` by default.
+        :param float timeout: Number of seconds to wait for new head block before watcher is checked.
+        :param float idle_timeout: Number of seconds tracker keeps running without pending transactions.
+        """
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.error = None
+        self._alive = True
+        self._pid = os.getpid()
+        self._pending = {}  # dict(str, _Tracked)
+        self._by_signature = {}  # dict(str, _Tracked), node could compute transaction id differently
+        self._lock = threading.Lock()
+        self._last_used = time.time()
+        self._heads = queue.Queue()
+        self._watcher = None
+        self._rpc = rpc.clone() if rpc else RpcClient()
+        self._rpc.open_ws(endpoint)
+        # blocks applied before tracker has started could not contain transactions tracked by it
+        self._last_block = self._rpc.send(
+            _request('database_api', 'get_dynamic_global_properties', [])
+        )['result']['head_block_number']
+        self._thread = threading.Thread(target=self._run, name="BroadcastTracker(%s)" % endpoint, daemon=True)
+
+    @classmethod
+    def get(cls, endpoint, rpc=None):
+        """
+        Get running tracker for endpoint, start new one if there is no tracker or previous one has stopped.
+
+        :param str endpoint:
+        :param RpcClient rpc: Client which clone is used by new tracker, see `__init__`.
+        :rtype: BroadcastTracker
+        """
+        with cls._trackers_lock:
+            tracker = cls._trackers.get(endpoint)
+            if not tracker or not tracker.alive:
+                tracker = cls(endpoint, rpc)
+                tracker._watch()
+                tracker._thread.start()
+                cls._trackers[endpoint] = tracker
+            tracker._last_used = time.time()  # returned tracker is not stopped as idle before it is used
+            return tracker
+
+    @property
+    def alive(self):
+        # forked child inherits tracker, but not its thread
+        return self._alive and self._pid == os.getpid()
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    def track(self, tx_id, signature, expiration):
+        """
+        Start tracking of transaction, it should be called before transaction is broadcast.
+
+        :param str tx_id: Transaction id.
+        :param str signature: Any of transaction signatures, None if transaction is not signed.
+        :param str expiration: Transaction expiration time, e.g. '2018-08-08T12:00:00'
+        :rtype: concurrent.futures.Future
+        :raise ValueError: Transaction with the same id is already tracked, e.g. identical operations were signed
+            within the same second, or tracker has stopped.
+        """
+        with self._lock:
+            if not self._alive:
+                raise ValueError("Tracking of transactions has stopped: %s" % self.error)
+            if tx_id in self._pending:
+                raise ValueError("Transaction %s is already broadcast." % tx_id)
+            tracked = self._pending[tx_id] = _Tracked(tx_id, signature, expiration)
+            if signature:
+                self._by_signature[signature] = tracked
+        return tracked.future
+
+    def resolve(self, tx_id, result):
+        """
+        Stop tracking of transaction and set result of its future, e.g. if node has rejected it.
+
+        :param str tx_id:
+        :param dict result:
+        """
+        with self._lock:
+            tracked = self._pending.pop(tx_id, None)
+            if tracked:
+                self._by_signature.pop(tracked.signature, None)
+            self._last_used = time.time()
+        if tracked and not tracked.future.done():
+            tracked.future.set_result(result)
+
+    def stop(self):
+        self._alive = False
+        self._heads.put(None)
+
+    def _watch(self):
+        watcher = HeadBlockWatcher.get(self.endpoint, self._rpc)
+        if watcher is not self._watcher:
+            watcher.add_listener(self._heads.put)
+            self._watcher = watcher
+
+    def _run(self):
+        try:
+            while self._alive and not self._stop_if_idle():
+                try:
+                    head = self._heads.get(timeout=self.timeout)
+                except queue.Empty:
+                    if not self._watcher.alive and not self._pending:
+                        break  # e.g. node was stopped, new tracker is started on next `get`
+                    self._watch()  # previous watcher could have stopped
+                    continue
+                if head is None:
+                    break
+                while self._last_block < head:
+                    if self._pending:
+                        self._check_block(self._last_block + 1)
+                    self._last_block += 1
+        except Exception as e:
+            self.error = e
+        finally:
+            with self._lock:  # transactions are not tracked after pending ones are resolved below
+                self._alive = False
+            if self._watcher:
+                self._watcher.remove_listener(self._heads.put)
+            for tx_id in list(self._pending):
+                self.resolve(tx_id, _error("Transaction tracking has stopped: %s" % self.error))
+            self._rpc.close_ws()
+
+    def _stop_if_idle(self):
+        """
+        :return bool: Tracker has stopped, because it had no pending transactions for `idle_timeout`.
+        """
+        with self._trackers_lock, self._lock:  # `get` doesn't return tracker which is being stopped
+            if self._pending or time.time() - self._last_used < self.idle_timeout:
+                return False
+            self._alive = False
+            return True
+
+    def _check_block(self, num):
+        block = self._rpc.send(_request('blockchain_history_api', 'get_block', [num]))['result']
+        if not block:
+            raise RuntimeError("Block %d is not available." % num)
+
+        for trx_num, (trx_id, trx) in enumerate(zip(block['transaction_ids'], block['transactions'])):
+            signatures = trx.get('signatures') or [None]
+            tracked = self._pending.get(trx_id) or self._by_signature.get(signatures[0])
+            if tracked:
+                self.resolve(tracked.tx_id, {"id": trx_id, "block_num": num, "trx_num": trx_num, "expired": False})
+
+        # transaction could not be included in block which is produced after its expiration
+        for tracked in [t for t in list(self._pending.values()) if t.expiration < block['timestamp']]:
+            self.resolve(tracked.tx_id, _error("Transaction %s has expired." % tracked.tx_id))
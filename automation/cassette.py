@@ -0,0 +1,170 @@
+import atexit
+import gzip
+import json
+import threading
+from collections import defaultdict, deque
+
+import websocket
+
+from automation.codec import DEFAULT_CODEC
+
+
+class CassetteMissError(Exception):
+    pass
+
+
+def _text(frame):
+    return frame.decode('utf8') if isinstance(frame, bytes) else frame
+
+
+def _is_notice(message):
+    return isinstance(message, dict) and message.get("method") == "notice"
+
+
+class Cassette(object):
+    """
+    Request/response frames pairs stored in gzipped JSON lines file together with url they were sent to.
+
+    Requests are matched by url and body regardless of their `id`. If the same request was recorded several times,
+    responses are replayed in recorded order, the last one is repeated when they run out.
+    """
+
+    def __init__(self, path):
+        """
+        :param str path: Path to cassette file, e.g. 'fifa.cassette.gz'
+        """
+        self.path = path
+        self._responses = defaultdict(deque)  # dict(str, deque(str))
+        self._file = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url, request):
+        """
+        :param str url: Websocket url request was sent to, e.g. 'ws://127.0.0.1:8090'
+        :param bytes|str request: Request frame.
+        :return str: Canonical form of url and request without ids.
+        """
+        body = DEFAULT_CODEC.decode(request)
+        for item in body if isinstance(body, list) else [body]:
+            item.pop("id", None)
+        return json.dumps([url, body], sort_keys=True, separators=(',', ':'))
+
+    def load(self):
+        with gzip.open(self.path, "rt", encoding="utf8") as f:
+            for line in f:
+                url, request, response = json.loads(line)
+                self._responses[self.key(url, request)].append(response)
+        return self
+
+    def record(self, url, request, response):
+        with self._lock:
+            if self._file is None:
+                self._file = gzip.open(self.path, "wt", encoding="utf8")
+                atexit.register(self.close)
+            self._file.write(json.dumps([url, _text(request), _text(response)]) + "\n")
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def replay(self, url, request):
+        """
+        :param str url: Websocket url request is sent to.
+        :param bytes|str request: Request frame.
+        :return str: Recorded response frame.
+        """
+        responses = self._responses.get(self.key(url, request))
+        if not responses:
+            raise CassetteMissError(
+                "Request to %s is missing in cassette '%s': %s" % (url, self.path, _text(request))
+            )
+        return responses.popleft() if len(responses) > 1 else responses[0]
+
+
+class RecordingTransport(object):
+    """
+    Websocket connection wrapper which writes every request/response pair to cassette.
+    """
+
+    def __init__(self, ws, cassette, url):
+        self._ws = ws
+        self._cassette = cassette
+        self._url = url
+        self._requests = deque()
+
+    @property
+    def connected(self):
+        return self._ws.connected
+
+    @property
+    def sock(self):
+        return self._ws.sock
+
+    def settimeout(self, timeout):
+        self._ws.settimeout(timeout)
+
+    def shutdown(self):
+        self._ws.shutdown()
+
+    def send(self, frame):
+        self._requests.append(frame)
+        self._ws.send(frame)
+
+    def recv(self):
+        frame = self._ws.recv()
+        if self._requests and not _is_notice(DEFAULT_CODEC.decode(frame)):
+            self._cassette.record(self._url, self._requests.popleft(), frame)
+        return frame
+
+
+class ReplayTransport(object):
+    """
+    Connection stand-in which serves responses recorded in cassette, without node.
+    """
+
+    sock = None
+
+    def __init__(self, cassette, url):
+        self._cassette = cassette
+        self._url = url
+        self._responses = deque()
+        self.connected = True
+
+    def settimeout(self, timeout):
+        pass
+
+    def shutdown(self):
+        self.connected = False
+
+    def send(self, frame):
+        request = DEFAULT_CODEC.decode(frame)
+        response = DEFAULT_CODEC.decode(self._cassette.replay(self._url, frame))
+        if isinstance(request, dict) and isinstance(response, dict):
+            response["id"] = request.get("id")
+        self._responses.append(_text(DEFAULT_CODEC.encode(response)))
+
+    def recv(self):
+        if not self._responses:
+            raise websocket.WebSocketTimeoutException("There are no responses to replay.")
+        return self._responses.popleft()
+
+
+def recording(path):
+    """
+    :param str path: Path to cassette file, it will be overwritten.
+    :return callable: `RpcClient` transport which records traffic of real websocket connections to cassette.
+    """
+    cassette = Cassette(path)
+    return lambda url: RecordingTransport(websocket.create_connection(url), cassette, url)
+
+
+def replaying(path):
+    """
+    :param str path: Path to recorded cassette file.
+    :return callable: `RpcClient` transport which serves responses from cassette.
+    """
+    cassette = Cassette(path).load()
+    return lambda url: ReplayTransport(cassette, url)
@@ -0,0 +1,89 @@
+import json
+import os
+
+
+class JsonCodec(object):
+    """
+    Encodes and decodes JSON-RPC frames with stdlib `json`.
+    """
+    name = "json"
+
+    def encode(self, obj):
+        """
+        :param obj: JSON serializable object.
+        :return bytes: UTF-8 encoded JSON.
+        """
+        return json.dumps(obj, ensure_ascii=False).encode('utf8')
+
+    def decode(self, data):
+        """
+        :param bytes|str data: JSON document.
+        """
+        if isinstance(data, bytes):  # json.loads accepts only str on python 3.5
+            data = data.decode('utf8')
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def encode(self, obj):
+        try:
+            return self._orjson.dumps(obj)
+        except TypeError:  # e.g. integers which are out of 64 bit range
+            return super().encode(obj)
+
+    def decode(self, data):
+        if isinstance(data, bytes) and type(data) is not bytes:  # e.g. `RequestFrame`, orjson accepts exact types
+            data = bytes(data)
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def encode(self, obj):
+        return self._ujson.dumps(obj, ensure_ascii=False).encode('utf8')
+
+    def decode(self, data):
+        return self._ujson.loads(data)
+
+
+CODECS = [OrjsonCodec, UjsonCodec, JsonCodec]  # in order of preference
+
+
+def available_codecs():
+    """
+    :return list(JsonCodec): Codecs which libraries are installed, in order of preference.
+    """
+    codecs = []
+    for cls in CODECS:
+        try:
+            codecs.append(cls())
+        except ImportError:
+            continue
+    return codecs
+
+
+def get_codec(name=None):
+    """
+    Get fastest installed codec, or codec with given name.
+
+    :param str name: One of 'orjson', 'ujson', 'json'.
+    :rtype: JsonCodec
+    """
+    for codec in available_codecs():
+        if not name or codec.name == name:
+            return codec
+    raise ValueError("JSON codec '%s' is not available." % name)
+
+
+DEFAULT_CODEC = get_codec(os.environ.get("AUTOSCORUM_JSON_CODEC"))
@@ -0,0 +1,114 @@
+import atexit
+import os
+import threading
+import time
+from collections import defaultdict
+
+from automation.rpc_client import PROBE_REQUEST, RpcClient
+
+
+def _key(endpoint, rpc):
+    # connections are interchangeable only if they encode and transport requests the same way
+    return endpoint, type(rpc), getattr(rpc, 'codec', None), getattr(rpc, 'transport', None)
+
+
+class ConnectionPool(object):
+    """
+    Pool of warm websocket connections keyed by node endpoint and client's class, codec and transport.
+
+    Connections are created with optional `warm_up` callback (e.g. login and api registration) and
+    returned to the pool instead of being closed, so next `Wallet` session on the same endpoint skips
+    websocket handshake and warm-up requests.
+    """
+
+    def __init__(self, max_idle=4, probe_after=5, probe_timeout=3):
+        """
+        :param int max_idle: Maximum number of idle connections kept per endpoint.
+        :param int probe_after: Number of seconds connection could stay idle before it is probed with request.
+        :param int probe_timeout: Number of seconds to wait for probe response.
+        """
+        self.max_idle = max_idle
+        self.probe_after = probe_after
+        self.probe_timeout = probe_timeout
+        self._idle = defaultdict(list)  # dict(tuple, list((RpcClient, float))), see `_key`
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def acquire(self, endpoint, warm_up=None, template=None):
+        """
+        Get healthy connection to endpoint, open new one if there are no idle connections.
+
+        :param str endpoint: Node rpc endpoint, e.g. '127.0.0.1:8090'
+        :param callable warm_up: Called with new RpcClient once connection is opened.
+        :param RpcClient template: Client which clone is opened as new connection, e.g. with record/replay
+            transport, only idle connections with the same codec and transport are reused. Plain `RpcClient`
+            by default.
+        :rtype: RpcClient
+        """
+        new = template.clone() if template else RpcClient()
+        key = _key(endpoint, new)
+        while True:
+            with self._lock:
+                self._check_fork()
+                if not self._idle[key]:
+                    break
+                rpc, released_at = self._idle[key].pop()
+            if self._is_healthy(rpc, released_at):
+                return rpc
+            rpc.close_ws()
+
+        rpc = new
+        rpc.open_ws(endpoint)
+        if warm_up:
+            warm_up(rpc)
+        return rpc
+
+    def release(self, endpoint, rpc):
+        """
+        Return connection to the pool, connection is closed if it is broken or pool is full.
+
+        :param str endpoint: Node rpc endpoint connection was acquired for.
+        :param RpcClient rpc:
+        """
+        if rpc.is_healthy():
+            key = _key(endpoint, rpc)
+            with self._lock:
+                self._check_fork()
+                if len(self._idle[key]) < self.max_idle:
+                    self._idle[key].append((rpc, time.time()))
+                    return
+        rpc.close_ws()
+
+    def clear(self, endpoint=None):
+        """
+        Close idle connections to given endpoint, or to all endpoints if it is not specified.
+        """
+        with self._lock:
+            self._check_fork()
+            keys = [key for key in self._idle if not endpoint or key[0] == endpoint]
+            connections = [rpc for key in keys for rpc, _ in self._idle.pop(key)]
+        for rpc in connections:
+            rpc.close_ws()
+
+    def _check_fork(self):
+        # sockets inherited from parent process should not be shared with it
+        if self._pid != os.getpid():
+            self._idle.clear()
+            self._pid = os.getpid()
+
+    def _is_healthy(self, rpc, released_at):
+        if not rpc.is_healthy():
+            return False
+        if time.time() - released_at < self.probe_after:
+            return True
+        try:
+            rpc.settimeout(self.probe_timeout)
+            return 'result' in rpc.send(PROBE_REQUEST)
+        except Exception:
+            return False
+        finally:
+            rpc.settimeout(None)
+
+
+POOL = ConnectionPool()
+atexit.register(POOL.clear)
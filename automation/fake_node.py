@@ -0,0 +1,416 @@
+import asyncio
+import hashlib
+import json
+import threading
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+import websockets
+
+from automation.codec import DEFAULT_CODEC
+
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+NULL_TIME = "1970-01-01T00:00:00"
+MAX_UINT_32 = 4294967295
+PRECISION = 10 ** 9
+
+CONFIG = {
+    "SCORUM_BLOCK_INTERVAL": 3,
+    "SCORUM_HARDFORK_REQUIRED_WITNESSES": 17,
+    "SCORUM_MAX_VOTED_WITNESSES": 20,
+    "SCORUM_MAX_WITNESSES": 21,
+    "SCORUM_VESTING_WITHDRAW_INTERVALS": 52,
+    "SCORUM_LIVE_TESTNET": False,
+    "SCORUM_BUDGETS_LIMIT_PER_OWNER": 100,
+    "SCORUM_MAX_TIME_UNTIL_EXPIRATION": 3600,
+}
+
+
+class FakeNodeError(Exception):
+    def __init__(self, message, code=10):
+        super().__init__(message)
+        self.code = code
+
+
+def _amount(value, symbol):
+    return "%d.%09d %s" % (value // PRECISION, value % PRECISION, symbol)
+
+
+def _parse_amount(amount):
+    value, symbol = amount.split()
+    integer, _, fraction = value.partition(".")
+    return int(integer) * PRECISION + int(fraction.ljust(9, "0")[:9]), symbol
+
+
+def _block_id(num, payload):
+    # first 4 bytes of block id is block number, like in scorumd
+    return "%08x" % num + hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+class FakeNode(object):
+    """
+    In-process stand-in of scorumd JSON-RPC websocket server.
+
+    Implements subset of `database_api`, `blockchain_history_api`, `account_history_api`, `tags_api`,
+    `login_api` and `network_broadcast_api` used by `Wallet`, so client stack could be benchmarked and tested
+    without docker and scorumd. Transactions are not validated, only transfers change balances.
+
+        with FakeNode(accounts=['alice', 'bob'], latency=0.005, payload_size=1024) as node:
+            with Wallet(node.chain_id, node.rpc_endpoint, [Account('alice')]) as wallet:
+                wallet.transfer('alice', 'bob', Amount('1.000000000 SCR'))
+    """
+
+    chain_id = "0" * 64
+
+    def __init__(self, accounts=(), balance="100.000000000 SCR", posts=0, latency=0, payload_size=0,
+                 block_interval=3, host="127.0.0.1", port=0):
+        """
+        :param list(str|Account) accounts: Accounts existing from genesis.
+        :param str balance: Initial SCR balance of each account.
+        :param int posts: Number of synthetic posts returned by tags_api.
+        :param float latency: Number of seconds each request is processed.
+        :param int payload_size: Size of filler added to accounts metadata, posts bodies and blocks.
+        :param float block_interval: Number of seconds between blocks, if 0 blocks are produced by `produce_block`.
+        :param str host:
+        :param int port: Port to listen, 0 to choose free one.
+        """
+        self.latency = latency
+        self.payload_size = payload_size
+        self.block_interval = block_interval
+        self.host = host
+        self.port = port
+
+        self._genesis_time = datetime.utcnow().replace(microsecond=0)
+        self._blocks = []  # list(dict), blocks[0] is block #1
+        self._pending = []  # list((dict, asyncio.Future))
+        self._ops = []  # list(dict), all operations history
+        self._history = {}  # dict(str, list(dict)), account operations history
+        self._accounts = {}  # dict(str, dict)
+        self._names = []  # sorted account names
+        self._contents = {}  # dict(str, dict)
+        self._subscriptions = {}  # dict(websocket, int)
+        self.requests = 0
+
+        for account in accounts:
+            self._create_account(getattr(account, "name", account), _parse_amount(balance)[0], self._key(account))
+        for i in range(posts):
+            author = self._names[i % len(self._names)] if self._names else "initdelegate"
+            self._create_content(author, "post-%d" % i, "", "category", "Post %d" % i, self._filler())
+
+        self._loop = None
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def rpc_endpoint(self):
+        return "{host}:{port}".format(host=self.host, port=self.port)
+
+    @property
+    def head_block_number(self):
+        return len(self._blocks)
+
+    def start(self):
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, args=(started,), name="FakeNode", daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self):
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+
+    def produce_block(self):
+        """
+        Produce block with pending transactions, thread-safe.
+
+        :return int: Number of produced block.
+        """
+        return asyncio.run_coroutine_threadsafe(self._produce_block(), self._loop).result()
+
+    def _run(self, started):
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(self._serve())
+        self.port = self._server.sockets[0].getsockname()[1]
+        producer = self._loop.create_task(self._produce_blocks()) if self.block_interval else None
+        started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            if producer:
+                producer.cancel()
+            self._server.close()
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+    async def _serve(self):
+        return await websockets.serve(self._handle, self.host, self.port, max_size=None, close_timeout=1)
+
+    async def _produce_blocks(self):
+        while True:
+            await asyncio.sleep(self.block_interval)
+            await self._produce_block()
+
+    async def _handle(self, ws, path=None):
+        try:
+            while True:
+                message = await ws.recv()
+                asyncio.ensure_future(self._reply(ws, message))
+        except websockets.ConnectionClosed:
+            self._subscriptions.pop(ws, None)
+
+    async def _reply(self, ws, message):
+        self.requests += 1
+        request = DEFAULT_CODEC.decode(message)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if isinstance(request, list):
+            response = []
+            for r in request:
+                response.append(await self._dispatch(ws, r))
+        else:
+            response = await self._dispatch(ws, request)
+        try:
+            await ws.send(DEFAULT_CODEC.encode(response).decode('utf8'))
+        except websockets.ConnectionClosed:
+            pass
+
+    async def _dispatch(self, ws, request):
+        method, params = request.get("method"), request.get("params", [])
+        if method == "call":
+            api, method, args = params
+        else:
+            api, args = "database_api", params
+        handler = getattr(self, "rpc_%s" % method, None)
+        response = {"jsonrpc": "2.0", "id": request.get("id")}
+        try:
+            if method == "set_block_applied_callback":
+                self._subscriptions[ws] = args[0]
+                response["result"] = None
+            elif handler is None:
+                raise FakeNodeError("Method '%s.%s' is not supported by fake node." % (api, method), code=-32601)
+            elif asyncio.iscoroutinefunction(handler):
+                response["result"] = await handler(*args)
+            else:
+                response["result"] = handler(*args)
+        except FakeNodeError as e:
+            response["error"] = {"code": e.code, "message": str(e)}
+        except (TypeError, ValueError, KeyError) as e:
+            response["error"] = {"code": -32602, "message": "Invalid params: %s" % e}
+        return response
+
+    async def _produce_block(self):
+        num = self.head_block_number + 1
+        timestamp = self._block_time(num)
+        pending, self._pending = self._pending, []
+        transactions = [tx for tx, _ in pending]
+        block = {
+            "previous": self._blocks[-1]["block_id"] if self._blocks else "0" * 40,
+            "timestamp": timestamp,
+            "witness": "initdelegate",
+            "transaction_merkle_root": "0" * 40,
+            "extensions": [self._filler()] if self.payload_size else [],
+            "witness_signature": "0" * 130,
+            "transactions": transactions,
+            "transaction_ids": [self._transaction_id(tx) for tx in transactions],
+            "signing_key": "SCR1111111111111111111111111111111114T1Anm",
+        }
+        block["block_id"] = _block_id(num, json.dumps(block, sort_keys=True))
+        self._blocks.append(block)
+
+        self._add_op(num, "", 0, 0, True, ["producer_reward", {"producer": "initdelegate", "reward": "0 SP"}])
+        for trx_num, (tx, future) in enumerate(pending):
+            for op_num, op in enumerate(tx["operations"]):
+                self._add_op(num, block["transaction_ids"][trx_num], trx_num, op_num, False, op)
+            if not future.done():
+                future.set_result({
+                    "id": block["transaction_ids"][trx_num], "block_num": num, "trx_num": trx_num, "expired": False
+                })
+
+        header = {k: block[k] for k in ("previous", "timestamp", "witness", "transaction_merkle_root", "extensions")}
+        for ws, callback_id in list(self._subscriptions.items()):
+            try:
+                await ws.send(json.dumps({"method": "notice", "params": [callback_id, [header]]}))
+            except websockets.ConnectionClosed:
+                self._subscriptions.pop(ws, None)
+        return num
+
+    def _block_time(self, num):
+        return (self._genesis_time + timedelta(seconds=3 * num)).strftime(TIME_FORMAT)
+
+    def _filler(self):
+        return "x" * self.payload_size
+
+    @staticmethod
+    def _key(account):
+        if hasattr(account, "get_owner_public"):
+            return account.get_owner_public()
+        return "SCR1111111111111111111111111111111114T1Anm"
+
+    @staticmethod
+    def _transaction_id(tx):
+        unsigned = {k: v for k, v in tx.items() if k != "signatures"}
+        return hashlib.sha256(json.dumps(unsigned, sort_keys=True).encode()).hexdigest()[:40]
+
+    def _create_account(self, name, balance, key):
+        authority = {"weight_threshold": 1, "account_auths": [], "key_auths": [[key, 1]]}
+        self._accounts[name] = {
+            "id": len(self._accounts), "name": name, "owner": authority, "active": authority, "posting": authority,
+            "memo_key": key, "json_metadata": self._filler(), "proxy": "", "created": self._block_time(0),
+            "created_by_genesis": True, "balance": balance, "scorumpower": 0, "delegated_scorumpower": 0,
+            "received_scorumpower": 0, "voting_power": 10000, "can_vote": True, "post_count": 0,
+            "last_vote_time": NULL_TIME, "last_post": NULL_TIME, "last_root_post": NULL_TIME,
+        }
+        self._names.insert(bisect_left(self._names, name), name)
+        self._history[name] = []
+
+    def _create_content(self, author, permlink, parent_author, parent_permlink, title, body):
+        self._contents["%s/%s" % (author, permlink)] = {
+            "id": len(self._contents), "author": author, "permlink": permlink, "category": parent_permlink,
+            "parent_author": parent_author, "parent_permlink": parent_permlink, "title": title, "body": body,
+            "json_metadata": "{}", "depth": 0 if not parent_author else 1, "children": 0, "net_rshares": 0,
+            "created": self._block_time(self.head_block_number), "cashout_time": NULL_TIME, "active_votes": [],
+        }
+
+    def _add_op(self, block_num, trx_id, trx_num, op_num, virtual, op):
+        record = {
+            "trx_id": trx_id, "block": block_num, "trx_in_block": trx_num, "op_in_trx": op_num,
+            "virtual_op": int(virtual), "timestamp": self._block_time(block_num), "op": op
+        }
+        self._ops.append(record)
+        name, data = op
+        for account in {data.get(k) for k in ("from", "to", "author", "voter", "producer", "owner")}:
+            if account in self._history:
+                self._history[account].append(record)
+        self._apply(name, data)
+
+    def _apply(self, name, data):
+        if name == "transfer":
+            amount, _ = _parse_amount(data["amount"])
+            self._accounts[data["from"]]["balance"] -= amount
+            self._accounts[data["to"]]["balance"] += amount
+        elif name == "comment":
+            self._create_content(data["author"], data["permlink"], data["parent_author"],
+                                 data["parent_permlink"], data["title"], data["body"])
+
+    def _format_account(self, account):
+        return dict(account, balance=_amount(account["balance"], "SCR"),
+                    scorumpower=_amount(account["scorumpower"], "SP"),
+                    delegated_scorumpower=_amount(account["delegated_scorumpower"], "SP"),
+                    received_scorumpower=_amount(account["received_scorumpower"], "SP"))
+
+    @staticmethod
+    def _page(records, _from, limit):
+        # operations with ids in [_from - limit, _from) in descending order, -1 is the most recent one
+        end = len(records) if _from < 0 or _from > len(records) else _from
+        return [[i, records[i]] for i in reversed(range(max(0, end - limit), end))]
+
+    # login_api
+
+    def rpc_login(self, username, password):
+        return True
+
+    def rpc_get_api_by_name(self, api_name):
+        return 0
+
+    # database_api
+
+    def rpc_get_dynamic_global_properties(self):
+        head = self.head_block_number
+        total = sum(a["balance"] for a in self._accounts.values())
+        return {
+            "id": 0, "head_block_number": head, "head_block_id": self._blocks[-1]["block_id"] if head else "0" * 40,
+            "time": self._block_time(head), "current_witness": "initdelegate",
+            "last_irreversible_block_num": max(0, head - 1), "total_supply": _amount(total, "SCR"),
+            "circulating_capital": _amount(total, "SCR"), "total_scorumpower": _amount(0, "SP"),
+            "majority_version": "0.0.0", "current_aslot": head, "participation_count": 128,
+        }
+
+    def rpc_get_config(self):
+        return CONFIG
+
+    def rpc_get_accounts(self, names):
+        return [self._format_account(self._accounts[name]) for name in names if name in self._accounts]
+
+    def rpc_lookup_accounts(self, lower_bound, limit):
+        start = bisect_left(self._names, lower_bound)
+        return self._names[start:start + limit]
+
+    def rpc_get_chain_capital(self):
+        props = self.rpc_get_dynamic_global_properties()
+        return dict(props, head_block_time=props["time"], total_scr=props["total_supply"])
+
+    # blockchain_history_api
+
+    def rpc_get_block(self, num):
+        return self._blocks[num - 1] if 0 < num <= self.head_block_number else None
+
+    def rpc_get_ops_in_block(self, num, operation_type=0):
+        return [
+            [i, op] for i, op in enumerate(self._ops)
+            if op["block"] == num and operation_type in (0, 1 + op["virtual_op"])
+        ]
+
+    def rpc_get_ops_history(self, from_op, limit, op_type=0):
+        return self._page(self._ops, from_op, limit)
+
+    # account_history_api
+
+    def rpc_get_account_history(self, name, _from, limit):
+        # operations with sequence numbers in [_from - limit, _from] in ascending order
+        if 0 <= _from < limit:
+            raise FakeNodeError("Assert Exception\nfrom >= limit: From must be greater than limit")
+        history = self._history.get(name, [])
+        end = len(history) if _from < 0 or _from >= min(MAX_UINT_32, len(history)) else _from + 1
+        return [[i, history[i]] for i in range(max(0, end - 1 - limit), end)]
+
+    # tags_api
+
+    def rpc_get_content(self, author, permlink):
+        return self._contents.get("%s/%s" % (author, permlink), {"id": 0, "author": "", "permlink": ""})
+
+    def rpc_get_contents(self, queries):
+        return [self.rpc_get_content(q["author"], q["permlink"]) for q in queries]
+
+    def rpc_get_posts_and_comments(self, query):
+        return list(self._contents.values())[:query.get("limit", 100)]
+
+    def rpc_get_discussions_by_created(self, query):
+        return [c for c in self.rpc_get_posts_and_comments(query) if not c["parent_author"]]
+
+    def rpc_get_trending_tags(self, start_tag, limit):
+        return []
+
+    # network_broadcast_api
+
+    def _check_transaction(self, tx):
+        head_time = datetime.strptime(self._block_time(self.head_block_number), TIME_FORMAT)
+        max_expiration = head_time + timedelta(seconds=CONFIG["SCORUM_MAX_TIME_UNTIL_EXPIRATION"])
+        if datetime.strptime(tx["expiration"], TIME_FORMAT) > max_expiration:
+            raise FakeNodeError("Assert Exception\ntrx.expiration <= now + fc::seconds(SCORUM_MAX_TIME_UNTIL_EXPIRATION)")
+        for name, data in tx["operations"]:
+            if name == "transfer":
+                if data["from"] not in self._accounts or data["to"] not in self._accounts:
+                    raise FakeNodeError("Assert Exception\nAccount does not exist.")
+                if self._accounts[data["from"]]["balance"] < _parse_amount(data["amount"])[0]:
+                    raise FakeNodeError("Assert Exception\nAccount does not have sufficient funds for transfer.")
+
+    async def rpc_broadcast_transaction_synchronous(self, tx):
+        self._check_transaction(tx)
+        future = asyncio.get_event_loop().create_future()
+        self._pending.append((tx, future))
+        return await future
+
+    def rpc_broadcast_transaction(self, tx):
+        self._check_transaction(tx)
+        self._pending.append((tx, asyncio.get_event_loop().create_future()))
+        return None
@@ -1,17 +1,23 @@
 import json
-from collections import namedtuple
+from hashlib import sha256
+from collections import namedtuple, OrderedDict
 
 from scorum.graphenebase.amount import Amount
 from scorum.utils.time import fmt_time_from_now
 
 from automation.account import Account
+from automation.keyring import derive_key_pairs
 
 GenesisAccount = namedtuple("GenesisAccount", ["account", "amount"])
 
 
+def _name(account):
+    return account.name if type(account) is Account else account
+
+
 class Genesis(object):
     def __init__(self):
-        self.genesis_accounts = []  # list(GenesisAccount))
+        self._accounts = OrderedDict()  # dict(str, GenesisAccount)
         self.witness_candidates = []  # list(Account)
         self.founders = set()  # set((str, float))
         self.reg_committee = set()  # set(str)
@@ -51,18 +57,35 @@ class Genesis(object):
     def __setitem__(self, key, value):
         self.params[key] = value
 
+    @property
+    def genesis_accounts(self):
+        return list(self._accounts.values())
+
     def add_account(self, name, balance="100.000000000 SCR"):
         amount = Amount(balance)
-        account = self.get_account(name)
-        if not account:
+        if _name(name) not in self._accounts:
             account = name if type(name) is Account else Account(name)
-            self.genesis_accounts.append(GenesisAccount(account, amount))
+            self._accounts[account.name] = GenesisAccount(account, amount)
+
+    def add_accounts(self, names, balance="100.000000000 SCR", processes=None):
+        """
+        Add many accounts at once, their owner keys are derived in pool of processes.
+
+        :param iterable names: Account names, name is used as password (as in `Account`).
+        :param str balance: Balance of each account.
+        :param int processes: Number of worker processes, see `derive_key_pairs`.
+        """
+        amount = Amount(balance)
+        names = [n for n in OrderedDict.fromkeys(names) if n not in self._accounts]
+        for name, (public, private) in zip(names, derive_key_pairs(names, processes=processes)):
+            self._accounts[name] = GenesisAccount(Account(name).set_keys('owner', public, private), amount)
 
     def get_account(self, name):
-        account = name if type(name) is Account else Account(name)
-        for ga in self.genesis_accounts:
-            if account == ga.account:
-                return ga.account
+        ga = self._accounts.get(_name(name))
+        return ga.account if ga else None
+
+    def has_account(self, name):
+        return _name(name) in self._accounts
 
     def add_witness_acc(self, name):
         account = self.get_account(name)
@@ -70,6 +93,19 @@ class Genesis(object):
             account.set_signing_key()
             self.witness_candidates.append(account)
 
+    def add_witness_accs(self, names, processes=None):
+        """
+        Add many witness candidates at once, their signing keys are derived in pool of processes.
+
+        :param iterable names: Names of accounts added to genesis.
+        :param int processes: Number of worker processes, see `derive_key_pairs`.
+        """
+        accounts = [a for a in (self.get_account(n) for n in names) if a]
+        pairs = derive_key_pairs([a.name for a in accounts], role='signing', processes=processes)
+        for account, (public, private) in zip(accounts, pairs):
+            account.set_signing_key().set_keys('signing', public, private)
+            self.witness_candidates.append(account)
+
     def add_founder_acc(self, name, percent: float):
         account = self.get_account(name)
         if account:
@@ -91,38 +127,53 @@ class Genesis(object):
             self.steemit_bounty_accounts.add(account.name)
 
     def calculate_supplies(self):
+        for key, items in self._calculate().items():
+            self[key] = list(items)
+
+    def write(self, fp):
+        """
+        Calculate supplies and write genesis json to file, the same `dump` returns after `calculate_supplies`.
+        Accounts and other lists are serialized one by one, so genesis with millions of accounts is not built in
+        memory.
+
+        :param fp: Text file object.
+        :return str: Chain id, sha256 of written json.
+        """
+        lists = self._calculate()
+        digest = sha256()
+
+        def emit(text):
+            fp.write(text)
+            digest.update(text.encode())
+
+        emit("{")
+        for i, (key, value) in enumerate(self.params.items()):
+            emit("%s%s: " % (", " if i else "", json.dumps(key)))
+            if key not in lists:
+                emit(json.dumps(value))
+                continue
+            emit("[")
+            for j, item in enumerate(lists[key]):
+                emit("%s%s" % (", " if j else "", json.dumps(item)))
+            emit("]")
+        emit("}")
+        return digest.hexdigest()
+
+    def _calculate(self):
+        """
+        Calculate supplies and set them to params.
+
+        :return dict(str, generator): Items of list params, produced lazily.
+        """
         # calculate accounts supply
-        for ga in self.genesis_accounts:
+        self.accounts_supply = Amount()
+        for ga in self._accounts.values():
             self.accounts_supply += ga.amount
-
-            account = {'name': ga.account.name,
-                       'scr_amount': str(ga.amount),
-                       'public_key': ga.account.get_owner_public()}
-            self['accounts'].append(account)
         self['accounts_supply'] = str(self.accounts_supply)
-        # collect witnesses
-        self['witness_candidates'] = [
-            {'name': acc.name, 'block_signing_key': acc.get_signing_public()}
-            for acc in self.witness_candidates
-        ]
-        # collect founders
-        self['founders'] = [
-            {'name': name, 'sp_percent': percent}
-            for name, percent in self.founders
-        ]
-        # collect dev_committee
-        self['development_committee'] = list(self.dev_committee)
-        # collect reg_committee
-        self['registration_committee'] = list(self.reg_committee)
         # calculate steemit_bounty supply
         bounty_per_acc = Amount(
             self['steemit_bounty_accounts_supply']
         ) / len(self.steemit_bounty_accounts)
-
-        self['steemit_bounty_accounts'] = [
-            {'name': acc, 'sp_amount': str(bounty_per_acc)}
-            for acc in self.steemit_bounty_accounts
-        ]
         self.steemit_bounty_supply = bounty_per_acc * len(
             self.steemit_bounty_accounts
         )
@@ -138,6 +189,27 @@ class Genesis(object):
             total += Amount(self[supply])
         self['total_supply'] = str(total)
 
+        return {
+            'accounts': (
+                {'name': ga.account.name, 'scr_amount': str(ga.amount), 'public_key': ga.account.get_owner_public()}
+                for ga in self._accounts.values()
+            ),
+            'witness_candidates': (
+                {'name': acc.name, 'block_signing_key': acc.get_signing_public()}
+                for acc in self.witness_candidates
+            ),
+            'founders': (
+                {'name': name, 'sp_percent': percent}
+                for name, percent in self.founders
+            ),
+            'development_committee': iter(self.dev_committee),
+            'registration_committee': iter(self.reg_committee),
+            'steemit_bounty_accounts': (
+                {'name': acc, 'sp_amount': str(bounty_per_acc)}
+                for acc in self.steemit_bounty_accounts
+            )
+        }
+
     def dump(self):
         return json.dumps(self.params)
 
@@ -145,4 +217,4 @@ class Genesis(object):
         self['initial_timestamp'] = fmt_time_from_now(1)
 
     def get_accounts(self):
-        return [ga.account for ga in self.genesis_accounts]
+        return [ga.account for ga in self._accounts.values()]
@@ -0,0 +1,254 @@
+import atexit
+import fcntl
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import threading
+from multiprocessing import Pool
+
+from scorum.graphenebase.account import PasswordKey
+
+MAGIC = b"SCRKEYS1"
+DIGEST_SIZE = 32
+KEY_SIZE = 64
+RECORD = struct.Struct("%ds%ds%ds" % (DIGEST_SIZE, KEY_SIZE, KEY_SIZE))
+PAIR = struct.Struct("%ds%ds" % (KEY_SIZE, KEY_SIZE))
+
+
+def key_digest(name, password, role):
+    """
+    :return bytes: Keyring lookup key of account key.
+    """
+    return hashlib.sha256("\0".join((name, password, role)).encode()).digest()
+
+
+def _encode(public, private):
+    public, private = public.encode(), private.encode()
+    if len(public) > KEY_SIZE or len(private) > KEY_SIZE:
+        raise ValueError("Key is longer than %d bytes." % KEY_SIZE)
+    return public, private
+
+
+def _pack(digest, public, private):
+    return RECORD.pack(digest, *_encode(public, private))
+
+
+def _unpack(buffer, offset):
+    _, public, private = RECORD.unpack_from(buffer, offset)
+    return public.rstrip(b"\0").decode(), private.rstrip(b"\0").decode()
+
+
+def _derive(args):
+    name, password, role = args
+    key = PasswordKey(name, password, role=role)
+    return str(key.get_public()), str(key.get_private())
+
+
+class KeyPairs(object):
+    """
+    Public and private keys of many accounts packed into fixed-width records, 128 bytes per pair.
+    """
+
+    def __init__(self, data=b""):
+        """
+        :param bytes data: Packed key pairs.
+        """
+        self._data = data
+
+    def __len__(self):
+        return len(self._data) // PAIR.size
+
+    def __getitem__(self, index):
+        """
+        :return tuple(str, str): Public and private key.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("Key pair index out of range.")
+        public, private = PAIR.unpack_from(self._data, index * PAIR.size)
+        return public.rstrip(b"\0").decode(), private.rstrip(b"\0").decode()
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+def derive_key_pairs(names, password=None, role='owner', processes=None, chunksize=256, keyring=None):
+    """
+    Derive keys of many accounts in pool of processes, keys found in keyring are not derived again.
+
+    :param list(str) names: Account names.
+    :param str password: Password of all accounts, account name by default (as in `Account`).
+    :param str role:
+    :param int processes: Number of worker processes, number of CPUs by default.
+    :param int chunksize: Number of keys derived by worker at once, fewer keys are derived in current process.
+    :param Keyring keyring: Keyring to look up and store keys, `KEYRING` by default.
+    :rtype: KeyPairs
+    """
+    keyring = keyring or KEYRING
+    args = [(name, password or name, role) for name in names]
+    pairs = [keyring.get(*a) for a in args]
+    missing = [i for i, pair in enumerate(pairs) if pair is None]
+    if len(missing) < chunksize or processes == 1:
+        derived = [_derive(args[i]) for i in missing]
+    else:
+        with Pool(processes) as pool:
+            derived = pool.map(_derive, [args[i] for i in missing], chunksize)
+    for i, pair in zip(missing, derived):
+        pairs[i] = pair
+        keyring.add(*(args[i] + pair))
+    return KeyPairs(b"".join(PAIR.pack(*_encode(*pair)) for pair in pairs))
+
+
+class Keyring(object):
+    """
+    Persistent store of derived account keys, so deterministic test keys are derived once for all runs and workers.
+
+    Keyring file is a header followed by fixed-width records sorted by sha256 of name, password and role. File is
+    memory-mapped and looked up with binary search, so opening keyring with millions of keys takes no time. New keys
+    are kept in memory until `save`, which merges them into file.
+
+    Keyring is disabled by default, enable it with `enable` or with AUTOSCORUM_KEYRING=<path> environment variable,
+    in latter case new keys are saved at process exit.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self._map = None
+        self._count = 0
+        self._pending = {}  # dict(bytes, tuple(str, str))
+        self._lock = threading.RLock()
+        self._save_registered = False
+
+    @property
+    def size(self):
+        """
+        :return int: Number of keys in file and not saved yet.
+        """
+        return self._count + len(self._pending)
+
+    def enable(self, path, save_at_exit=True):
+        """
+        :param str path: Keyring file, it is created on first `save`.
+        :param bool save_at_exit: Save new keys at process exit.
+        """
+        with self._lock:
+            self.path = path
+            self.enabled = True
+            self._load()
+        if save_at_exit and not self._save_registered:
+            atexit.register(self.save)
+            self._save_registered = True
+
+    def disable(self):
+        with self._lock:
+            self.enabled = False
+            self._close()
+
+    def get(self, name, password, role):
+        """
+        :return tuple(str, str)|None: Public and private key, None if key is not in keyring.
+        """
+        if not self.enabled:
+            return None
+        digest = key_digest(name, password, role)
+        with self._lock:
+            pair = self._pending.get(digest)
+            if pair:
+                return pair
+            return self._find(digest)
+
+    def add(self, name, password, role, public, private):
+        if not self.enabled:
+            return
+        digest = key_digest(name, password, role)
+        with self._lock:
+            self._pending[digest] = (public, private)
+
+    def populate(self, names, password=None, roles=('owner',), processes=None):
+        """
+        Derive and store keys of accounts which are not in keyring yet, e.g. before large genesis is built.
+
+        :param iterable names: Account names.
+        :param str password: Password of all accounts, account name by default (as in `Account`).
+        :param tuple(str) roles:
+        :param int processes: Number of worker processes, see `derive_key_pairs`.
+        :return int: Number of derived keys.
+        :raise RuntimeError: Keyring is not enabled, derived keys would be lost.
+        """
+        if not self.enabled:
+            raise RuntimeError("Keyring is not enabled.")
+        names = list(names)
+        size = self.size
+        for role in roles:
+            derive_key_pairs(names, password, role, processes, keyring=self)
+        return self.size - size
+
+    def save(self):
+        """
+        Merge new keys into keyring file, keys saved by other processes meanwhile are kept.
+        """
+        with self._lock:
+            if not self.enabled or not self._pending:
+                return
+            with open(self.path + ".lock", "w") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                self._load()
+                added = ((digest, _pack(digest, *pair)) for digest, pair in sorted(self._pending.items()))
+                tmp_path = "%s.%d.tmp" % (self.path, os.getpid())
+                with open(tmp_path, "wb") as f:
+                    f.write(MAGIC)
+                    last = None
+                    for digest, record in heapq.merge(self._records(), added):
+                        if digest != last:
+                            f.write(record)
+                            last = digest
+                os.replace(tmp_path, self.path)
+                self._pending.clear()
+                self._load()
+
+    def _load(self):
+        self._close()
+        if not os.path.exists(self.path) or os.path.getsize(self.path) <= len(MAGIC):
+            return
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self._close()
+            raise ValueError("%s is not a keyring file." % self.path)
+        self._count = (len(self._map) - len(MAGIC)) // RECORD.size
+
+    def _close(self):
+        if self._map:
+            self._map.close()
+        self._map = None
+        self._count = 0
+
+    def _offset(self, index):
+        return len(MAGIC) + index * RECORD.size
+
+    def _find(self, digest):
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            offset = self._offset(middle)
+            current = self._map[offset:offset + DIGEST_SIZE]
+            if current < digest:
+                low = middle + 1
+            elif current > digest:
+                high = middle
+            else:
+                return _unpack(self._map, offset)
+        return None
+
+    def _records(self):
+        for index in range(self._count):
+            offset = self._offset(index)
+            yield self._map[offset:offset + DIGEST_SIZE], self._map[offset:offset + RECORD.size]
+
+
+KEYRING = Keyring()
+
+if os.environ.get("AUTOSCORUM_KEYRING"):
+    KEYRING.enable(os.environ["AUTOSCORUM_KEYRING"])
@@ -1,4 +1,3 @@
-from hashlib import sha256
 from os.path import join
 
 from scorum.utils.files import create_temp_dir, remove_file
@@ -75,9 +74,7 @@ class Node(object):
     def generate_configs(self):
         if self.genesis is not None:
             with open(self.genesis_path, 'w') as gfd:  # genesis file descriptor
-                g = self.genesis.dump()
-                self.chain_params["chain_id"] = sha256(g.encode()).hexdigest()
-                gfd.write(g)
+                self.chain_params["chain_id"] = self.genesis.write(gfd)
 
         if self.config is not None:
             with open(self.config_path, 'w') as cfd:  # config file descriptor
@@ -0,0 +1,65 @@
+import queue
+import threading
+
+_DONE = object()
+
+
+class _Error(object):
+    def __init__(self, error):
+        self.error = error
+
+
+class _Producer(object):
+    """
+    Iterates over iterable in background thread and puts its items to bounded queue until consumer has stopped.
+    """
+
+    def __init__(self, iterable, depth):
+        self.iterable = iterable
+        self.items = queue.Queue(maxsize=depth)
+        self.stopped = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self._run, name="prefetch", daemon=True).start()
+
+    def _put(self, item):
+        while not self.stopped.is_set():
+            try:
+                self.items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        try:
+            for item in self.iterable:
+                if not self._put(item):
+                    return
+        except Exception as e:
+            self._put(_Error(e))
+        else:
+            self._put(_DONE)
+
+
+def prefetch(iterable, depth=1):
+    """
+    Iterate over `iterable` in background thread, so next items are produced while current one is consumed,
+    e.g. next page is requested from node while current page is processed.
+
+    :param iterable iterable:
+    :param int depth: Maximum number of items produced ahead.
+    :return generator: Items of `iterable` in the same order, its exceptions are re-raised.
+    """
+    producer = _Producer(iterable, depth)
+    producer.start()
+    try:
+        while True:
+            item = producer.items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Error):
+                raise item.error
+            yield item
+    finally:
+        producer.stopped.set()  # consumer has stopped iteration, e.g. generator was closed
@@ -0,0 +1,59 @@
+import _struct
+import re
+import threading
+import time
+from binascii import unhexlify
+
+RE_TAPOS_ERROR = re.compile(r"tapos", re.IGNORECASE)
+
+
+def ref_block_params(props):
+    """
+    :param dict props: Result of `get_dynamic_global_properties`.
+    :return tuple(int, int): TaPoS `ref_block_num` and `ref_block_prefix` referencing head block.
+    """
+    ref_block_num = props['head_block_number'] & 0xFFFF
+    ref_block_prefix = _struct.unpack_from("<I", unhexlify(props['head_block_id']), 4)[0]
+    return ref_block_num, ref_block_prefix
+
+
+def is_tapos_error(response):
+    """
+    :param dict response: Response on broadcast request.
+    :return bool: Transaction was rejected because of its reference block.
+    """
+    error = response.get('error') if isinstance(response, dict) else None
+    return bool(error) and RE_TAPOS_ERROR.search(str(error)) is not None
+
+
+class RefBlockProvider(object):
+    """
+    Caches TaPoS reference block, so transactions broadcast within `max_age` seconds reuse it instead of
+    requesting head block before each of them.
+
+    Any recent block is valid reference until it is forked out, so cached block is dropped on TaPoS error.
+    """
+
+    def __init__(self, max_age=30):
+        """
+        :param float max_age: Number of seconds reference block is reused.
+        """
+        self.max_age = max_age
+        self._params = None
+        self._fetched_at = 0
+        self._lock = threading.Lock()
+
+    def get(self, get_props):
+        """
+        :param callable get_props: Returns dynamic global properties, called if cached block is outdated.
+        :return tuple(int, int): `ref_block_num` and `ref_block_prefix`.
+        """
+        with self._lock:
+            if self._params is None or time.time() - self._fetched_at > self.max_age:
+                self._params = ref_block_params(get_props())
+                self._fetched_at = time.time()
+            return self._params
+
+    def invalidate(self):
+        with self._lock:
+            self._params = None
@@ -0,0 +1,92 @@
+import threading
+import time
+from collections import OrderedDict
+
+from automation.codec import DEFAULT_CODEC
+
+# `cashout_time` of content which rewards were already paid, it is set to `fc::time_point_sec::maximum()`
+PAID_OUT_CASHOUT_TIMES = ("1969-12-31T23:59:59", "2106-02-07T06:28:15")
+
+
+def is_paid_out(content):
+    """
+    :param dict content: Result of `get_content`.
+    :rtype: bool
+    """
+    return isinstance(content, dict) and content.get("cashout_time") in PAID_OUT_CASHOUT_TIMES
+
+
+class ResponseCache(object):
+    """
+    Size bounded LRU cache of RPC results which could not change: irreversible blocks and their operations,
+    chain config, paid out content.
+
+    Results are stored encoded, every `get` returns new object, so callers could modify it. Cache tracks last
+    irreversible block number (LIB) of the node, if it goes backwards (e.g. node was restarted with new chain on the
+    same endpoint) all cached results are dropped.
+    """
+
+    def __init__(self, max_size=1024, lib_ttl=3, codec=DEFAULT_CODEC):
+        """
+        :param int max_size: Maximum number of cached results.
+        :param float lib_ttl: Number of seconds known LIB is considered up to date.
+        :param JsonCodec codec: Codec used to store results.
+        """
+        self.max_size = max_size
+        self.lib_ttl = lib_ttl
+        self.codec = codec
+        self.last_irreversible_block_num = 0
+        self.hits = 0
+        self.misses = 0
+        self._lib_updated_at = 0
+        self._items = OrderedDict()  # dict(tuple, bytes)
+        self._lock = threading.Lock()
+
+    @property
+    def lib_expired(self):
+        return time.time() - self._lib_updated_at > self.lib_ttl
+
+    def update_lib(self, num):
+        """
+        :param int num: Last irreversible block number reported by node.
+        """
+        with self._lock:
+            if num < self.last_irreversible_block_num:
+                self._items.clear()
+            self.last_irreversible_block_num = num
+            self._lib_updated_at = time.time()
+
+    def is_irreversible(self, num):
+        return num <= self.last_irreversible_block_num
+
+    def get(self, key):
+        """
+        :param tuple key: Method name and its arguments.
+        :return: Cached result or None.
+        """
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+        return self.codec.decode(data)
+
+    def put(self, key, result):
+        """
+        :param tuple key: Method name and its arguments.
+        :param result: Immutable result of the method.
+        """
+        data = self.codec.encode(result)
+        with self._lock:
+            self._items[key] = data
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.last_irreversible_block_num = 0
+            self._lib_updated_at = 0
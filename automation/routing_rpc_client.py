@@ -0,0 +1,178 @@
+import random
+import threading
+import time
+
+import websocket
+
+from automation.rpc_client import RpcClient, is_read_request
+
+CONNECTION_ERRORS = (OSError, websocket.WebSocketException)
+
+
+class _Endpoint(object):
+    def __init__(self, addr, latency):
+        self.addr = addr
+        self.rpc = None
+        self.latency = latency  # moving average of response time in seconds
+        self.failures = 0
+        self.retry_at = 0
+
+    @property
+    def weight(self):
+        return 1 / max(self.latency, 0.0001)
+
+
+class RoutingRpcClient(object):
+    """
+    RpcClient stand-in which spreads read requests over several nodes and sends the rest to single writer node.
+
+    Readers are chosen randomly with probability inversely proportional to their average latency. Reader which
+    connection has failed is ejected, request is retried on another one; ejected reader is reconnected after backoff.
+
+        rpc = RoutingRpcClient(['10.0.0.1:8090', '10.0.0.2:8090', '10.0.0.3:8090'])
+        with Wallet(chain_id, '10.0.0.1:8090', rpc=rpc) as wallet:  # wallet's endpoint is the writer
+            ...
+    """
+
+    def __init__(self, readers, writer=None, smoothing=0.2, min_backoff=0.5, max_backoff=30, connect_timeout=1):
+        """
+        :param list(str) readers: Endpoints of nodes serving read requests, e.g. ['127.0.0.1:8090']
+        :param str writer: Endpoint of node receiving broadcasts and subscriptions, endpoint passed to `open_ws`
+            by default.
+        :param float smoothing: Weight of the latest response time in average latency.
+        :param float min_backoff: Number of seconds failed reader is ejected for, doubled on each failure in a row.
+        :param float max_backoff: Maximum number of seconds reader is ejected for.
+        :param float connect_timeout: Number of seconds to wait for reader on (re)connection.
+        """
+        self.smoothing = smoothing
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.connect_timeout = connect_timeout
+        self.readers = [_Endpoint(addr, latency=0.01) for addr in readers]
+        self.writer = _Endpoint(writer, latency=0.01) if writer else None
+        self._lock = threading.Lock()
+        self._on_notice = None
+
+    def clone(self):
+        """
+        :return RoutingRpcClient: New not connected client with the same readers, writer and settings.
+        """
+        return type(self)([r.addr for r in self.readers], self.writer.addr if self.writer else None,
+                          self.smoothing, self.min_backoff, self.max_backoff, self.connect_timeout)
+
+    @property
+    def on_notice(self):
+        return self._on_notice
+
+    @on_notice.setter
+    def on_notice(self, handler):
+        self._on_notice = handler
+        if self.writer and self.writer.rpc:
+            self.writer.rpc.on_notice = handler
+
+    def open_ws(self, addr, timeout=30):
+        """
+        :param str addr: Writer endpoint, if it was not specified on creation.
+        :param float timeout: Number of seconds to wait for writer.
+        """
+        if not self.writer:
+            self.writer = _Endpoint(addr, latency=0.01)
+        self.writer.rpc = RpcClient()
+        self.writer.rpc.on_notice = self._on_notice
+        self.writer.rpc.open_ws(self.writer.addr, timeout)
+        for reader in self.readers:
+            self._connect(reader)
+        if not any(r.rpc for r in self.readers):
+            raise ConnectionError("None of readers is available: %s" % [r.addr for r in self.readers])
+
+    def close_ws(self):
+        for endpoint in self.readers + [self.writer]:
+            if endpoint and endpoint.rpc:
+                endpoint.rpc.close_ws()
+                endpoint.rpc = None
+
+    def settimeout(self, timeout):
+        for endpoint in self.readers + [self.writer]:
+            if endpoint and endpoint.rpc:
+                endpoint.rpc.settimeout(timeout)
+
+    def is_healthy(self):
+        return bool(self.writer and self.writer.rpc and self.writer.rpc.is_healthy())
+
+    def poll_notice(self, timeout):
+        return self.writer.rpc.poll_notice(timeout)
+
+    def send(self, json_request):
+        if not isinstance(json_request, (bytes, str)) or not is_read_request(json_request):
+            return self.writer.rpc.send(json_request)
+        return self._read(lambda rpc: rpc.send(json_request))
+
+    def send_batch(self, json_requests):
+        if all(isinstance(r, (bytes, str)) and is_read_request(r) for r in json_requests):
+            return self._read(lambda rpc: rpc.send_batch(json_requests))
+        return self.writer.rpc.send_batch(json_requests)
+
+    def _read(self, call):
+        tried = set()
+        while True:
+            reader, rpc = self._choose(tried)
+            if not reader:
+                raise ConnectionError("None of readers is available: %s" % [r.addr for r in self.readers])
+            tried.add(reader)
+            started = time.time()
+            try:
+                response = call(rpc)
+            except CONNECTION_ERRORS:
+                self._eject(reader, rpc)
+                continue
+            with self._lock:
+                reader.latency += self.smoothing * (time.time() - started - reader.latency)
+                reader.failures = 0
+            return response
+
+    def _choose(self, excluded):
+        """
+        :return tuple(_Endpoint, RpcClient): Reader and its connection captured under lock, as concurrent `_eject`
+            could drop it; (None, None) if there is no available reader.
+        """
+        with self._lock:
+            now = time.time()
+            ejected = [r for r in self.readers if not r.rpc and r.retry_at <= now and r not in excluded]
+            for reader in ejected:  # other threads should not reconnect them at the same time
+                reader.retry_at = now + self.connect_timeout
+        for reader in ejected:
+            self._connect(reader)
+
+        with self._lock:
+            candidates = [r for r in self.readers if r.rpc and r not in excluded]
+            if not candidates:
+                return None, None
+            point = random.uniform(0, sum(r.weight for r in candidates))
+            for reader in candidates:
+                point -= reader.weight
+                if point <= 0:
+                    return reader, reader.rpc
+            return candidates[-1], candidates[-1].rpc
+
+    def _connect(self, reader):
+        rpc = RpcClient()
+        try:
+            rpc.open_ws(reader.addr, timeout=self.connect_timeout)
+        except CONNECTION_ERRORS:  # including TimeoutError
+            self._eject(reader)
+            return
+        with self._lock:
+            reader.rpc = rpc
+
+    def _eject(self, reader, rpc=None):
+        """
+        :param _Endpoint reader:
+        :param RpcClient rpc: Failed connection, reader is not ejected if it has been reconnected meanwhile.
+        """
+        with self._lock:
+            if not rpc or reader.rpc is rpc:
+                rpc, reader.rpc = reader.rpc, None
+                reader.retry_at = time.time() + min(self.min_backoff * 2 ** reader.failures, self.max_backoff)
+                reader.failures += 1
+        if rpc:
+            rpc.close_ws()
@@ -1,30 +1,244 @@
 import json
+import random
+import select
+import threading
 import time
 
 import websocket
 
+from automation.codec import DEFAULT_CODEC
+from automation.rpc_stats import STATS, rpc_method_name
 
-class RpcClient(object):
+PROBE_REQUEST = json.dumps({
+    "jsonrpc": "2.0", "id": 0, "method": "call", "params": ["database_api", "get_dynamic_global_properties", []]
+})
+
+# errors raised while node is starting: port is not bound yet, or it is bound but rpc plugin is not serving yet
+NOT_READY_ERRORS = (OSError, websocket.WebSocketException)
+
+NON_COALESCED_APIS = ('network_broadcast_api', 'debug_node_api')
+
+
+class RequestFrame(bytes):
+    """
+    Encoded request which keeps name of called method, so request is classified without decoding.
+    """
+    rpc_method = None  # str, 'api.method'
+
+
+def request_frame(body, codec=DEFAULT_CODEC):
+    """
+    :param dict body: JSON-RPC request body.
+    :param JsonCodec codec:
+    :rtype: RequestFrame
+    """
+    frame = RequestFrame(codec.encode(body))
+    frame.rpc_method = rpc_method_name(body)
+    return frame
+
+
+def is_read_request(frame):
+    """
+    :param bytes|str frame: Request frame, only `RequestFrame` could be classified as read request.
+    :return bool: Request only reads node state, so identical concurrent requests could share one response.
+    """
+    if not getattr(frame, 'rpc_method', None):
+        return False
+    api, _, method = frame.rpc_method.rpartition('.')
+    return method != 'batch' and api not in NON_COALESCED_APIS and not method.startswith(('set_', 'broadcast_'))
+
+
+class _InFlight(object):
     def __init__(self):
+        self.done = threading.Event()
+        self.response_frame = None
+        self.error = None
+
+
+class RpcClient(object):
+    """
+    Websocket JSON-RPC client which could be shared between threads.
+
+    Requests are sent one at a time. Identical read requests issued concurrently by several threads are coalesced:
+    only the first one is sent to node, the rest wait for its response and get their own decoded copy of it.
+    """
+
+    def __init__(self, codec=DEFAULT_CODEC, transport=websocket.create_connection, coalesce=True):
+        """
+        :param JsonCodec codec: Codec used to decode responses and encode batch frames.
+        :param callable transport: Called with websocket url, returns connection object with websocket-client
+            interface (send, recv, settimeout, shutdown, connected), e.g. `automation.cassette.replaying(path)`.
+        :param bool coalesce: Share response between identical concurrent read requests.
+        """
+        self.codec = codec
+        self.transport = transport
+        self.coalesce = coalesce
         self._ws = None
+        self._lock = threading.RLock()
+        self._in_flight = {}  # dict(bytes|str, _InFlight)
+        self._in_flight_lock = threading.Lock()
+        self.on_notice = None  # callable(callback_id, args), called on subscription notices
+
+    def clone(self):
+        """
+        :return RpcClient: New not connected client with the same codec, transport and coalescing.
+        """
+        return type(self)(codec=self.codec, transport=self.transport, coalesce=self.coalesce)
 
-    def open_ws(self, addr):
-        retries = 0
-        error = None
-        while retries < 10:
+    def open_ws(self, addr, timeout=30, probe=True, min_delay=0.01, max_delay=1):
+        """
+        Connect to node, retrying with exponential backoff and jitter until node is ready or deadline is reached.
+
+        :param str addr: Node rpc endpoint, e.g. '127.0.0.1:8090'
+        :param float timeout: Overall number of seconds to wait for node.
+        :param bool probe: Check that node answers `get_dynamic_global_properties` with head block before returning.
+        :param float min_delay: Delay before first retry in seconds.
+        :param float max_delay: Upper bound of delay between retries in seconds.
+        """
+        deadline = time.time() + timeout
+        delay = min_delay
+        while True:
             try:
-                self._ws = websocket.create_connection("ws://{addr}".format(addr=addr))
-                return
-            except ConnectionRefusedError as e:
+                self._ws = self.transport("ws://{addr}".format(addr=addr))
+                if not probe or self._probe(deadline - time.time()):
+                    return
+                error = ConnectionError("Node %s has no head block yet." % addr)
+            except NOT_READY_ERRORS as e:
                 error = e
-                retries += 1
-                time.sleep(0.5)
-        raise error
+            self.close_ws()
+            self._ws = None
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutError("Node %s is not ready in %s seconds: %s" % (addr, timeout, error)) from error
+            time.sleep(min(remaining, random.uniform(delay / 2, delay)))
+            delay = min(delay * 2, max_delay)
+
+    def _probe(self, timeout):
+        """
+        :param float timeout: Number of seconds to wait for response.
+        :return bool: Node answers rpc requests and has head block.
+        """
+        self.settimeout(max(timeout, 0.01))
+        try:
+            response = self.send(PROBE_REQUEST)
+        finally:
+            self._ws.settimeout(None)
+        return 'head_block_number' in (response.get('result') or {})
 
     def close_ws(self):
         if self._ws:
-            self._ws.shutdown()
+            try:
+                self._ws.shutdown()
+            except NOT_READY_ERRORS:
+                pass
+
+    def settimeout(self, timeout):
+        """
+        :param float timeout: Timeout of socket operations in seconds, `None` to block.
+        """
+        self._ws.settimeout(timeout)
+
+    def is_healthy(self):
+        """
+        Check that connection is open and has no unread data, e.g. peer has not closed it.
+
+        :rtype: bool
+        """
+        if not self._ws or not self._ws.connected:
+            return False
+        if getattr(self._ws, 'sock', None) is None:  # transport without socket, e.g. replay
+            return True
+        readable, _, _ = select.select([self._ws.sock], [], [], 0)
+        return not readable
 
     def send(self, json_request):
-        self._ws.send(json_request)
-        return json.loads(self._ws.recv())
+        if not self.coalesce or not isinstance(json_request, (bytes, str)) or not is_read_request(json_request):
+            return self._roundtrip(json_request)[0]
+
+        with self._in_flight_lock:
+            call = self._in_flight.get(json_request)
+            leader = call is None
+            if leader:
+                call = self._in_flight[json_request] = _InFlight()
+
+        if not leader:
+            call.done.wait()
+            if call.error:
+                raise call.error
+            return self.codec.decode(call.response_frame)
+
+        try:
+            message, call.response_frame = self._roundtrip(json_request)
+            return message
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[json_request]
+            call.done.set()
+
+    def poll_notice(self, timeout):
+        """
+        Wait for subscription notice and pass it to `on_notice` handler.
+
+        :param float timeout: Number of seconds to wait.
+        :return bool: True if notice was received, False on timeout.
+        """
+        self._ws.settimeout(timeout)
+        try:
+            return self._handle_notice(self.codec.decode(self._ws.recv()))
+        except websocket.WebSocketTimeoutException:
+            return False
+        finally:
+            self._ws.settimeout(None)
+
+    def _roundtrip(self, frame):
+        """
+        :return tuple: Decoded response and its raw frame.
+        """
+        with self._lock:
+            started = time.time()
+            self._ws.send(frame)
+            while True:
+                response_frame = self._ws.recv()
+                if not response_frame:  # close frame, e.g. node is stopping
+                    raise websocket.WebSocketConnectionClosedException("Connection is closed by node.")
+                message = self.codec.decode(response_frame)
+                if not self._handle_notice(message):
+                    break
+        if STATS.enabled:
+            error = isinstance(message, dict) and 'error' in message
+            STATS.record(frame, time.time() - started, len(frame), len(response_frame), error)
+        return message, response_frame
+
+    def _handle_notice(self, message):
+        if not isinstance(message, dict) or message.get("method") != "notice":
+            return False
+        if self.on_notice:
+            self.on_notice(*message["params"])
+        return True
+
+    def send_batch(self, json_requests):
+        """
+        Send several requests as one JSON-RPC 2.0 batch frame.
+
+        :param list json_requests: Request bodies, e.g. results of `Wallet.json_rpc_body`.
+        :return list: Responses in the same order as requests.
+        """
+        requests = [self.codec.decode(r) if isinstance(r, (bytes, str)) else dict(r) for r in json_requests]
+        original_ids = [r.get("id") for r in requests]
+        for _id, request in enumerate(requests):
+            request["id"] = _id  # node could answer on batch items in any order
+
+        response, _ = self._roundtrip(self.codec.encode(requests))
+        if isinstance(response, dict):  # whole batch was rejected
+            return [response] * len(requests)
+
+        by_id = {r.get("id"): r for r in response}
+        responses = []
+        for _id, original_id in enumerate(original_ids):
+            r = by_id.get(_id, {"id": _id, "error": {"message": "Response is missing in batch."}})
+            r["id"] = original_id
+            responses.append(r)
+        return responses
@@ -0,0 +1,137 @@
+import atexit
+import json
+import os
+import threading
+
+from automation.codec import DEFAULT_CODEC
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)  # seconds
+
+
+def rpc_method_name(request):
+    """
+    :param bytes|str|dict request: JSON-RPC request body.
+    :return str: Name of called method in 'api.method' format, e.g. 'database_api.get_accounts'
+    """
+    if getattr(request, 'rpc_method', None):  # e.g. `RequestFrame`, method is known without decoding
+        return request.rpc_method
+    if not isinstance(request, dict):
+        request = DEFAULT_CODEC.decode(request)
+    if isinstance(request, list):
+        return "batch"
+    params = request.get("params") or []
+    if request.get("method") == "call" and len(params) > 1:
+        return "%s.%s" % (params[0], params[1])
+    return request.get("method", "unknown")
+
+
+class _MethodStats(object):
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency_total = 0.0
+        self.latency_min = None
+        self.latency_max = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.request_bytes = 0
+        self.request_bytes_max = 0
+        self.response_bytes = 0
+        self.response_bytes_max = 0
+
+    def add(self, latency, request_size, response_size, error):
+        self.calls += 1
+        self.errors += int(error)
+        self.latency_total += latency
+        self.latency_min = latency if self.latency_min is None else min(self.latency_min, latency)
+        self.latency_max = max(self.latency_max, latency)
+        self.histogram[self._bucket(latency)] += 1
+        self.request_bytes += request_size
+        self.request_bytes_max = max(self.request_bytes_max, request_size)
+        self.response_bytes += response_size
+        self.response_bytes_max = max(self.response_bytes_max, response_size)
+
+    @staticmethod
+    def _bucket(latency):
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                return i
+        return len(LATENCY_BUCKETS)
+
+    def as_dict(self):
+        bounds = ["<=%s" % b for b in LATENCY_BUCKETS] + [">%s" % LATENCY_BUCKETS[-1]]
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency": {
+                "total": self.latency_total,
+                "mean": self.latency_total / self.calls,
+                "min": self.latency_min,
+                "max": self.latency_max,
+                "histogram": dict(zip(bounds, self.histogram))
+            },
+            "request_bytes": {"total": self.request_bytes, "max": self.request_bytes_max},
+            "response_bytes": {"total": self.response_bytes, "max": self.response_bytes_max}
+        }
+
+
+class RpcStats(object):
+    """
+    Collects number of calls, errors, latency histogram and request/response sizes per 'api.method'.
+
+    Collection is disabled by default, enable it with `enable` or with AUTOSCORUM_RPC_STATS=<path> environment
+    variable, in latter case stats are written to the path at process exit.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._methods = {}  # dict(str, _MethodStats)
+        self._lock = threading.Lock()
+        self._dump_path = None
+
+    def enable(self, dump_path=None):
+        """
+        :param str dump_path: If specified, stats are written to this file at process exit.
+        """
+        self.enabled = True
+        if dump_path and not self._dump_path:
+            atexit.register(self._dump_at_exit)
+        self._dump_path = dump_path or self._dump_path
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._methods.clear()
+
+    def record(self, request, latency, request_size, response_size, error=False):
+        """
+        :param bytes|str|dict request: Sent request body, used to get name of called method.
+        :param float latency: Number of seconds between sending request and receiving response.
+        :param int request_size: Size of request frame.
+        :param int response_size: Size of response frame.
+        :param bool error: Node returned error.
+        """
+        method = rpc_method_name(request)
+        with self._lock:
+            if method not in self._methods:
+                self._methods[method] = _MethodStats()
+            self._methods[method].add(latency, request_size, response_size, error)
+
+    def as_dict(self):
+        with self._lock:
+            return {method: stats.as_dict() for method, stats in self._methods.items()}
+
+    def dump(self, path):
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2, sort_keys=True)
+
+    def _dump_at_exit(self):
+        if self._dump_path and self._methods:
+            self.dump(self._dump_path)
+
+
+STATS = RpcStats()
+
+if os.environ.get("AUTOSCORUM_RPC_STATS"):
+    STATS.enable(os.environ["AUTOSCORUM_RPC_STATS"])
@@ -0,0 +1,43 @@
+import os
+from itertools import islice
+from multiprocessing import Pool
+
+from scorum.graphenebase.signedtransactions import SignedTransaction
+
+MAX_TIME_UNTIL_EXPIRATION = 3600  # SCORUM_MAX_TIME_UNTIL_EXPIRATION, counted by node from head block time
+
+
+def _sign(args):
+    ref_block_num, ref_block_prefix, expiration, chain_id, ops, keys = args
+    tx = SignedTransaction(ref_block_num=ref_block_num,
+                           ref_block_prefix=ref_block_prefix,
+                           expiration=expiration,
+                           operations=ops)
+    tx.sign(keys, chain_id)
+    return tx.json()
+
+
+def sign_transactions(transactions, chain_id, ref_block_num, ref_block_prefix, expiration, processes=None,
+                      chunksize=64):
+    """
+    Sign transactions in pool of processes. Transactions are sent to pool in windows of `chunksize` per worker and
+    next window is taken only when previous one is being consumed, so generated load is not read into memory at once.
+
+    :param iterable transactions: Pairs of operations list and private keys list, consumed lazily.
+    :param str chain_id:
+    :param int ref_block_num:
+    :param int ref_block_prefix:
+    :param str expiration: Expiration time of all transactions, e.g. '2018-08-08T12:00:00'
+    :param int processes: Number of worker processes, number of CPUs by default.
+    :param int chunksize: Number of transactions sent to worker at once.
+    :return generator: JSON of signed transactions in the same order as they were given.
+    """
+    args = ((ref_block_num, ref_block_prefix, expiration, chain_id, ops, keys) for ops, keys in transactions)
+    window = (processes or os.cpu_count() or 1) * chunksize
+    with Pool(processes) as pool:
+        signed = pool.imap(_sign, list(islice(args, window)), chunksize)
+        while signed is not None:
+            current = signed
+            batch = list(islice(args, window))
+            signed = pool.imap(_sign, batch, chunksize) if batch else None  # signed while current window is consumed
+            yield from current
@@ -1,7 +1,10 @@
-import _struct
-import json
+import queue
+import re
 import time
-from binascii import unhexlify
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import copy
+from itertools import islice
 
 import scorum.graphenebase.operations_fabric as operations
 from scorum.graphenebase.amount import Amount
@@ -9,33 +12,275 @@ from scorum.graphenebase.signedtransactions import SignedTransaction
 from scorum.utils.time import fmt_time_from_now
 
 from automation.account import Account
-from automation.rpc_client import RpcClient
+from automation.block_watcher import HeadBlockWatcher
+from automation.broadcast_tracker import BroadcastTracker
+from automation.prefetch import prefetch
+from automation.ref_block import RefBlockProvider, is_tapos_error, ref_block_params
+from automation.response_cache import is_paid_out
+from automation.rpc_client import RpcClient, request_frame
+from automation.signing import MAX_TIME_UNTIL_EXPIRATION, sign_transactions
+
+
+class _RequestRecorded(Exception):
+    pass
+
+
+class _RequestRecorder(object):
+    def __init__(self):
+        self.request = None
+
+    def send(self, json_request):
+        self.request = json_request
+        raise _RequestRecorded()
+
+
+class WalletBatch(object):
+    """
+    Collects Wallet calls and sends them to node as one JSON-RPC 2.0 batch frame.
+
+    Only methods which send single request and return its result as is could be batched
+    (e.g. `get_accounts`, `get_content`, `get_budget`, `get_block` without waiting).
+
+        with wallet.batch() as batch:
+            batch.get_chain_capital()
+            batch.get_accounts(owners)
+        capital, accounts = batch.results
+    """
+
+    def __init__(self, wallet):
+        self._wallet = wallet
+        self._requests = []
+        self.results = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.send()
+
+    def __getattr__(self, name):
+        method = getattr(self._wallet, name)
+        if not callable(method):
+            return method
+
+        def collect(*args, **kwargs):
+            recorder = _RequestRecorder()
+            wallet = copy(self._wallet)
+            wallet.rpc = recorder
+            wallet.cache = None
+            try:
+                getattr(wallet, name)(*args, **kwargs)
+            except _RequestRecorded:
+                pass
+            if recorder.request is None:
+                raise ValueError("Method '%s' does not send requests and could not be batched." % name)
+            self._requests.append(recorder.request)
+        return collect
+
+    def send(self):
+        """
+        Send collected requests (if any) and store their results in `results`.
+
+        :return list: Results in the same order as calls were made.
+        """
+        if self._requests:
+            responses = self._wallet.rpc.send_batch(self._requests)
+            self.results += [r['result'] if 'result' in r else r for r in responses]
+            self._requests = []
+        return self.results
+
+
+# operations which require posting authority, node rejects transaction mixing them with active/owner ones
+POSTING_OPERATIONS = ('vote', 'comment', 'comment_options', 'delete_comment')
+
+
+def _authority(op):
+    """
+    :return str: 'posting' or 'active' (which also stands for owner) authority class of operation.
+    """
+    op = getattr(op, 'op', op)  # operation class wrapped into `Operation`
+    name = getattr(op, 'name', None) or re.sub(r'(?<!^)(?=[A-Z])', '_', type(op).__name__)
+    posting = {n.replace('_', '') for n in POSTING_OPERATIONS}
+    return 'posting' if name.replace('_', '').lower() in posting else 'active'
+
+
+class WalletBulk(object):
+    """
+    Collects operations of Wallet write calls and broadcasts them packed into multi-operation transactions.
+
+    Signing keys are picked by Wallet methods as for single transactions, every packed transaction is signed with
+    keys of all its operations. Operations keep their order, so they could depend on preceding ones. Operations
+    requiring posting authority are never packed together with active ones, new transaction is started when
+    authority changes.
+
+        with wallet.bulk() as bulk:
+            for name in names:
+                bulk.transfer(DEFAULT_WITNESS, name, Amount("10.000000000 SCR"))
+                bulk.vote(name, author, permlink)
+        results = bulk.results  # one per transaction
+    """
+
+    def __init__(self, wallet, max_ops=100, max_size=32 * 1024):
+        """
+        :param Wallet wallet:
+        :param int max_ops: Maximum number of operations in transaction.
+        :param int max_size: Maximum size of serialized operations of transaction in bytes.
+        """
+        self._wallet = wallet
+        self.max_ops = max_ops
+        self.max_size = max_size
+        self._ops = []  # list((op, list(str)))
+        self.results = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.send()
+
+    def __getattr__(self, name):
+        method = getattr(self._wallet, name)
+        if not callable(method):
+            return method
+
+        def collect(*args, **kwargs):
+            collected = []
+            wallet = copy(self._wallet)
+            wallet.broadcast_transaction_synchronous = lambda ops, keys=[]: collected.append((ops, keys))
+            getattr(wallet, name)(*args, **kwargs)
+            if not collected:
+                raise ValueError("Method '%s' does not broadcast operations and could not be packed." % name)
+            for ops, keys in collected:
+                self.add(ops, keys)
+        return collect
+
+    def add(self, ops, keys):
+        """
+        :param list ops: Operations to pack.
+        :param list(str) keys: Private keys required to sign operations.
+        """
+        self._ops += [(op, list(keys)) for op in ops]
+
+    def pack(self):
+        """
+        :return list(tuple(list, list)): Operations and signing keys of each transaction.
+        """
+        transactions = []
+        ops, keys, size, authority = [], [], 0, None
+        for op, op_keys in self._ops:
+            op_size = len(bytes(op))
+            op_authority = _authority(op)
+            if ops and (len(ops) >= self.max_ops or size + op_size > self.max_size or op_authority != authority):
+                transactions.append((ops, keys))
+                ops, keys, size = [], [], 0
+            authority = op_authority
+            ops.append(op)
+            keys += [k for k in op_keys if k not in keys]
+            size += op_size
+        if ops:
+            transactions.append((ops, keys))
+        return transactions
+
+    def send(self):
+        """
+        Broadcast packed transactions (if any) without waiting for each of them, then wait until all are in blocks.
+
+        :return list: Results of transactions as `broadcast_transaction_synchronous` returns them.
+        """
+        futures = [self._wallet.broadcast_transaction(ops, keys) for ops, keys in self.pack()]
+        self._ops = []
+        self.results += [f.result() for f in futures]
+        return self.results
 
 
 class Wallet(object):
-    def __init__(self, chain_id, rpc_endpoint, accounts=[]):
+    def __init__(self, chain_id, rpc_endpoint, accounts=(), pool=None, rpc=None, cache=None, ref_block=None):
+        """
+        :param str chain_id:
+        :param str rpc_endpoint: Node rpc endpoint, e.g. '127.0.0.1:8090'
+        :param list(Account) accounts: Accounts which keys are used to sign transactions.
+        :param ConnectionPool pool: If specified, warm connection is taken from the pool instead of opening new one,
+            it is returned to the pool on exit.
+        :param RpcClient rpc: Client to use instead of default one, e.g. with record/replay transport. If pool is
+            specified, pooled connections are clones of it.
+        :param ResponseCache cache: If specified, irreversible blocks, their operations, config and paid out content
+            are taken from the cache after first request.
+        :param RefBlockProvider ref_block: Source of TaPoS reference block for broadcast transactions.
+        """
         self.chain_id = chain_id
-        self.accounts = accounts
+        self._accounts = OrderedDict()  # dict(str, Account)
+        self.add_accounts(accounts)
         self.endpoint = rpc_endpoint
+        self.pool = pool
+        self.cache = cache
+        self.ref_block = ref_block if ref_block else RefBlockProvider()
 
-        self.rpc = RpcClient()
+        self.rpc = rpc if rpc else RpcClient()
+        self._rpc_template = self.rpc
 
     def __enter__(self):
-        self.rpc.open_ws(self.endpoint)
+        if self.pool:
+            self.rpc = self.pool.acquire(self.endpoint, warm_up=self._warm_up, template=self._rpc_template)
+        else:
+            self.rpc.open_ws(self.endpoint)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.rpc.close_ws()
+        if self.pool and exc_type is None:
+            self.pool.release(self.endpoint, self.rpc)
+        else:
+            self.rpc.close_ws()
+        if self.pool:  # connection is not owned by wallet anymore
+            self.rpc = None
+
+    def _warm_up(self, rpc):
+        rpc.send(self.json_rpc_body('login', "", "", api='login_api'))
+        rpc.send(self.json_rpc_body('call', 'login_api', 'get_api_by_name', ['database_api']))
+        rpc.send(self.json_rpc_body('call', 'login_api', 'get_api_by_name', ['network_broadcast_api']))
+
+    def batch(self):
+        """
+        Collect calls within context and send them as one JSON-RPC batch frame on exit.
+
+        :rtype: WalletBatch
+        """
+        return WalletBatch(self)
+
+    def bulk(self, max_ops=100, max_size=32 * 1024):
+        """
+        Collect operations of write calls within context and broadcast them packed into few transactions on exit.
+
+        :param int max_ops: Maximum number of operations in transaction.
+        :param int max_size: Maximum size of serialized operations of transaction in bytes.
+        :rtype: WalletBulk
+        """
+        return WalletBulk(self, max_ops, max_size)
+
+    @property
+    def accounts(self):
+        return list(self._accounts.values())
+
+    @accounts.setter
+    def accounts(self, accounts):
+        self._accounts.clear()
+        self.add_accounts(accounts)
 
     def add_account(self, account):
         acc = account if type(account) is Account else Account(account)
-        self.accounts.append(acc)
+        self._accounts[acc.name] = acc
+
+    def add_accounts(self, accounts):
+        """
+        :param iterable accounts: Accounts or their names, account with the same name is replaced.
+        """
+        self._accounts.update(
+            (acc.name, acc) for acc in (a if type(a) is Account else Account(a) for a in accounts)
+        )
 
     def account(self, name: str):
-        for account in self.accounts:
-            if account.name == name:
-                return account
-        return None
+        return self._accounts.get(name)
 
     @staticmethod
     def json_rpc_body(name, *args, api=None, as_json=True, _id=0, kwargs=None):
@@ -62,16 +307,24 @@ class Wallet(object):
         else:
             body_dict = {**headers, "method": name, "params": args}
         if as_json:
-            return json.dumps(body_dict, ensure_ascii=False).encode('utf8')
+            return request_frame(body_dict)
         else:
             return body_dict
 
     def get_dynamic_global_properties(self):
         response = self.rpc.send(self.json_rpc_body('get_dynamic_global_properties', api='database_api'))
         try:
-            return response['result']
+            result = response['result']
         except KeyError:
             return response
+        if self.cache:
+            self.cache.update_lib(result['last_irreversible_block_num'])
+        return result
+
+    def _is_irreversible(self, num):
+        if not self.cache.is_irreversible(num) and self.cache.lib_expired:
+            self.get_dynamic_global_properties()
+        return self.cache.is_irreversible(num)
 
     def get_circulating_capital(self):
         return Amount(self.get_dynamic_global_properties()['circulating_capital'])
@@ -98,21 +351,51 @@ class Wallet(object):
             return response
 
     def list_all_accounts(self):
-        limit = 100
-        names = []
-        last = ""
-        while True:
-            accs = self.list_accounts(limit, last)
-
-            if len(names) == 0:
-                names += accs
-            else:
-                names += accs[1:]
-
-            if len(accs) < limit or names[-1] == last:
-                break
-            last = accs[-1]
-        return names
+        return list(self.iter_account_names())
+
+    def iter_account_names(self, page_size=1000):
+        """
+        Names of all accounts in alphabetical order, next page is requested while current one is consumed.
+
+        :param int page_size: Number of names requested at once.
+        :return generator:
+        """
+        def pages():
+            last = None
+            while True:
+                page = self.list_accounts(page_size, last or "")
+                if isinstance(page, dict):  # error response
+                    raise RuntimeError("Could not list accounts: %s" % page)
+                yield page if last is None else page[1:]  # page starts with last name of previous one
+                if len(page) < page_size or page[-1] == last:
+                    return
+                last = page[-1]
+
+        for names in prefetch(pages()):
+            yield from names
+
+    def iter_accounts(self, names=None, chunk_size=500):
+        """
+        Account objects requested with `get_accounts` by chunks, next chunk is requested while current one is
+        consumed.
+
+        :param iterable names: Names of accounts, all accounts by default.
+        :param int chunk_size: Number of accounts requested at once.
+        :return generator:
+        """
+        def chunks():
+            it = iter(self.iter_account_names() if names is None else names)
+            while True:
+                chunk = list(islice(it, chunk_size))
+                if not chunk:
+                    return
+                accounts = self.get_accounts(chunk)
+                if isinstance(accounts, dict):  # error response
+                    raise RuntimeError("Could not get accounts: %s" % accounts)
+                yield accounts
+
+        for accounts in prefetch(chunks()):
+            yield from accounts
 
     def list_buddget_owners(self, limit: int = 100, budget_type="post"):
         response = self.rpc.send(self.json_rpc_body(
@@ -124,11 +407,18 @@ class Wallet(object):
             return response
 
     def get_config(self):
+        if self.cache:
+            config = self.cache.get(('get_config',))
+            if config:
+                return config
         response = self.rpc.send(self.json_rpc_body('call', 'database_api', 'get_config', []))
         try:
-            return response['result']
+            config = response['result']
         except KeyError:
             return response
+        if self.cache:
+            self.cache.put(('get_config',), config)
+        return config
 
     def list_witnesses(self, limit: int = 100):
         response = self.rpc.send(self.json_rpc_body('call', 'database_api', 'lookup_witness_accounts', ["", limit]))
@@ -146,6 +436,90 @@ class Wallet(object):
         except KeyError:
             return response
 
+    def iter_account_history(self, name: str, page_size=100, op_types=None):
+        """
+        Walk whole account history from the most recent operation to the oldest one, next page is requested while
+        current one is consumed.
+
+        :param str name:
+        :param int page_size: Number of operations requested at once.
+        :param set(str) op_types: Names of operations to yield, e.g. {'transfer', 'producer_reward'}, all by default.
+        :return generator: [sequence number, operation object] pairs.
+        """
+        return self._iter_history(
+            lambda _from, limit: self.get_account_history(name, _from, limit),
+            4294967295, page_size, inclusive=True, op_types=op_types
+        )
+
+    def iter_ops_history(self, page_size=100, op_type=0, op_types=None):
+        """
+        Walk operations of all blocks from the most recent one to the oldest one, next page is requested while
+        current one is consumed.
+
+        :param int page_size: Number of operations requested at once. Max: 100.
+        :param int op_type: Operations type filtered by node (all = 0, not_virt = 1, virt = 2, market = 3).
+        :param set(str) op_types: Names of operations to yield, all by default.
+        :return generator: [id, operation object] pairs.
+        """
+        return self._iter_history(
+            lambda from_op, limit: self.get_ops_history(from_op, limit, op_type),
+            -1, page_size, inclusive=False, op_types=op_types
+        )
+
+    def iter_account_transfers(self, name: str, _from="sp", to="scr", page_size=100):
+        """
+        Walk all account transfers of given type from the most recent one to the oldest one.
+
+        :return generator: [id, transfer] pairs.
+        """
+        return self._iter_history(
+            lambda starts, limit: self.get_account_transfers(name, _from, to, starts, limit),
+            -1, page_size, inclusive=True
+        )
+
+    def iter_devcommittee_transfers(self, _from="sp", to="scr", page_size=100):
+        """
+        Walk all devcommittee transfers of given type from the most recent one to the oldest one.
+
+        :return generator: [id, transfer] pairs.
+        """
+        return self._iter_history(
+            lambda starts, limit: self.get_devcommittee_transfers(_from, to, starts, limit),
+            -1, page_size, inclusive=True
+        )
+
+    @staticmethod
+    def _iter_history(fetch, start, page_size, inclusive, op_types=None):
+        """
+        :param callable fetch: Called with cursor and limit, returns page of [id, object] pairs.
+        :param int start: Cursor of the most recent item.
+        :param int page_size:
+        :param bool inclusive: Page ends with item pointed by cursor (account history), not before it (ops history).
+            Such APIs require cursor to be not less than limit.
+        :param set(str) op_types: Names of operations to yield.
+        """
+        def pages():
+            cursor, last_id = start, None
+            while True:
+                limit = page_size if last_id is None or not inclusive else min(page_size, cursor)
+                page = fetch(cursor, limit)
+                if isinstance(page, dict):  # error response
+                    raise RuntimeError("Could not get history page: %s" % page)
+                # pages could overlap, only items older than already yielded are taken
+                items = sorted((i for i in page if last_id is None or i[0] < last_id), key=lambda i: i[0], reverse=True)
+                if not items:
+                    return
+                last_id = items[-1][0]
+                if op_types:
+                    items = [i for i in items if i[1]['op'][0] in op_types]
+                yield items
+                if last_id == 0:
+                    return
+                cursor = last_id - 1 if inclusive else last_id
+
+        for items in prefetch(pages()):
+            yield from items
+
     def get_account_transfers(self, name: str, _from="sp", to="scr", starts=-1, limit=100):
         transfer_types = ["sp", "scr"]
         if _from not in transfer_types and to not in transfer_types or(_from == "sp" and to == "sp"):
@@ -195,6 +569,11 @@ class Wallet(object):
         def request():
             return self.rpc.send(self.json_rpc_body('get_block', num, api='blockchain_history_api'))
 
+        if self.cache and self._is_irreversible(num):
+            block = self.cache.get(('get_block', num))
+            if block:
+                return block
+
         wait = kwargs.get('wait_for_block', False)
 
         response = request()
@@ -203,12 +582,15 @@ class Wallet(object):
         except KeyError:
             return response
         if wait and not block:
-            timer = 1
-            time_to_wait = kwargs.get('time_to_wait', num * 3) * 10
-            while timer < time_to_wait and not block:
+            time_to_wait = kwargs.get('time_to_wait', num * 3)
+            deadline = time.time() + time_to_wait
+            if HeadBlockWatcher.get(self.endpoint, self.rpc).wait(num, time_to_wait):
+                block = request()['result']
+            while time.time() < deadline and not block:  # fallback if watcher has stopped
                 time.sleep(0.1)
-                timer += 1
                 block = request()['result']
+        if self.cache and block and self._is_irreversible(num):
+            self.cache.put(('get_block', num), block)
         return block
 
     def get_ops_in_block(self, num, operation_type=0):
@@ -219,13 +601,93 @@ class Wallet(object):
         :param int operation_type: Operations type (all = 0, not_virt = 1, virt = 2, market = 3)
         :rtype: dict
         """
+        key = ('get_ops_in_block', num, operation_type)
+        irreversible = self.cache and self._is_irreversible(num)
+        if irreversible:
+            ops = self.cache.get(key)
+            if ops is not None:
+                return ops
         response = self.rpc.send(self.json_rpc_body(
             'call', 'blockchain_history_api', 'get_ops_in_block', [num, operation_type]
         ))
         try:
-            return response['result']
+            ops = response['result']
         except KeyError:
             return response
+        if irreversible:
+            self.cache.put(key, ops)
+        return ops
+
+    def get_blocks(self, start, stop, connections=4, batch_size=50):
+        """
+        Fetch range of blocks over several connections, blocks are yielded in order while next ones are fetched.
+
+        :param int start: Number of first block.
+        :param int stop: Number of last block, it is included.
+        :param int connections: Maximum number of connections to fetch blocks with, wallet's own one is used too.
+        :param int batch_size: Number of blocks requested with single JSON-RPC batch frame.
+        :return generator: (block number, block) pairs, block is None if it does not exist yet.
+        """
+        return self._fetch_range(
+            lambda num: self.json_rpc_body('get_block', num, api='blockchain_history_api'),
+            start, stop, connections, batch_size
+        )
+
+    def get_ops_in_blocks(self, start, stop, operation_type=0, connections=4, batch_size=50):
+        """
+        Fetch operations of range of blocks over several connections, they are yielded in order of blocks while next
+        ones are fetched.
+
+        :param int start: Number of first block.
+        :param int stop: Number of last block, it is included.
+        :param int operation_type: Operations type (all = 0, not_virt = 1, virt = 2, market = 3)
+        :param int connections: Maximum number of connections to fetch operations with, wallet's own one is used too.
+        :param int batch_size: Number of blocks requested with single JSON-RPC batch frame.
+        :return generator: (block number, operations) pairs.
+        """
+        return self._fetch_range(
+            lambda num: self.json_rpc_body('call', 'blockchain_history_api', 'get_ops_in_block', [num, operation_type]),
+            start, stop, connections, batch_size
+        )
+
+    def _fetch_range(self, request, start, stop, connections, batch_size):
+        chunks = [range(n, min(n + batch_size, stop + 1)) for n in range(start, stop + 1, batch_size)]
+        connections = max(1, min(connections, len(chunks)))
+        clients = queue.Queue()
+        clients.put(self.rpc)
+        opened = []
+
+        def fetch(nums):
+            try:
+                rpc = clients.get_nowait()
+            except queue.Empty:  # all connections are busy, there are no more of them than workers
+                if self.pool:
+                    rpc = self.pool.acquire(self.endpoint, warm_up=self._warm_up, template=self._rpc_template)
+                else:  # the same transport as wallet's own client, e.g. replay or routing
+                    rpc = self.rpc.clone()
+                    rpc.open_ws(self.endpoint)
+                opened.append(rpc)
+            try:
+                responses = rpc.send_batch([request(num) for num in nums])
+                return [(num, r['result'] if 'result' in r else r) for num, r in zip(nums, responses)]
+            finally:
+                clients.put(rpc)
+
+        try:
+            with ThreadPoolExecutor(max_workers=connections) as executor:
+                pending = deque()
+                for nums in chunks:
+                    pending.append(executor.submit(fetch, nums))
+                    if len(pending) >= connections * 2:  # bounds number of buffered results
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+        finally:
+            for rpc in opened:
+                if self.pool:
+                    self.pool.release(self.endpoint, rpc)
+                else:
+                    rpc.close_ws()
 
     def get_ops_history(self, from_op=-1, limit=100, op_type=0):
         """
@@ -305,11 +767,7 @@ class Wallet(object):
             return response
 
     def get_ref_block_params(self):
-        props = self.get_dynamic_global_properties()
-        ref_block_num = props['head_block_number'] - 1 & 0xFFFF
-        ref_block = self.get_block(props['head_block_number'])
-        ref_block_prefix = _struct.unpack_from("<I", unhexlify(ref_block["previous"]), 4)[0]
-        return ref_block_num, ref_block_prefix
+        return ref_block_params(self.get_dynamic_global_properties())
 
     def get_budget(self, uuid, budget_type="post"):
         response = self.rpc.send(self.json_rpc_body(
@@ -468,11 +926,18 @@ class Wallet(object):
         return self.broadcast_transaction_synchronous([op], [signing_key])
 
     def get_content(self, author, permlink=""):
+        if self.cache:
+            content = self.cache.get(('get_content', author, permlink))
+            if content:
+                return content
         response = self.rpc.send(self.json_rpc_body('call', 'tags_api', 'get_content', [author, permlink]))
         try:
-            return response['result']
+            content = response['result']
         except KeyError:
             return response
+        if self.cache and is_paid_out(content):
+            self.cache.put(('get_content', author, permlink), content)
+        return content
 
     def get_contents(self, content_queries: list):
         """
@@ -622,8 +1087,8 @@ class Wallet(object):
         signing_key = self.account(creator).get_active_private()
         return self.broadcast_transaction_synchronous([op], [signing_key])
 
-    def broadcast_transaction_synchronous(self, ops, keys=[]):
-        ref_block_num, ref_block_prefix = self.get_ref_block_params()
+    def _sign_transaction(self, ops, keys):
+        ref_block_num, ref_block_prefix = self.ref_block.get(self.get_dynamic_global_properties)
 
         tx = SignedTransaction(ref_block_num=ref_block_num,
                                ref_block_prefix=ref_block_prefix,
@@ -631,14 +1096,73 @@ class Wallet(object):
                                operations=ops)
 
         tx.sign(keys, self.chain_id)
-        response = self.rpc.send(
-            self.json_rpc_body('call', 'network_broadcast_api', "broadcast_transaction_synchronous", [tx.json()]))
+        return tx
+
+    def sign_transactions(self, transactions, expiration=3000, processes=None):
+        """
+        Sign many transactions in pool of processes, e.g. to pre-generate load. All of them reference the same block,
+        so they should be broadcast before it becomes too old.
+
+            for tx in wallet.sign_transactions(([op], [key]) for op, key in generate_ops()):
+                wallet.rpc.send(wallet.json_rpc_body('call', 'network_broadcast_api', 'broadcast_transaction', [tx]))
+
+        :param iterable transactions: Pairs of operations list and private keys list.
+        :param int expiration: Number of seconds transactions are valid for, head block time of node may lag behind
+                               local time, so keep it below `MAX_TIME_UNTIL_EXPIRATION`.
+        :param int processes: Number of worker processes, number of CPUs by default.
+        :return generator: JSON of signed transactions in the same order as they were given.
+        :raise ValueError: Expiration is beyond the limit, node would reject all transactions.
+        """
+        if expiration > MAX_TIME_UNTIL_EXPIRATION:
+            raise ValueError("Expiration %d is longer than %d seconds." % (expiration, MAX_TIME_UNTIL_EXPIRATION))
+        ref_block_num, ref_block_prefix = self.ref_block.get(self.get_dynamic_global_properties)
+        return sign_transactions(
+            transactions, self.chain_id, ref_block_num, ref_block_prefix, fmt_time_from_now(expiration), processes
+        )
+
+    def broadcast_transaction_synchronous(self, ops, keys=[]):
+        for _ in range(2):  # second attempt with fresh reference block if cached one was forked out
+            tx = self._sign_transaction(ops, keys)
+            response = self.rpc.send(
+                self.json_rpc_body('call', 'network_broadcast_api', "broadcast_transaction_synchronous", [tx.json()]))
+            if not is_tapos_error(response):
+                break
+            self.ref_block.invalidate()
 
         try:
             return response['result']
         except KeyError:
             return response
 
+    def broadcast_transaction(self, ops, keys=[]):
+        """
+        Broadcast transaction without waiting for it to be included in block.
+
+        :param list ops: Operations of transaction.
+        :param list(str) keys: Private keys to sign transaction with.
+        :return concurrent.futures.Future: Resolved with the same result `broadcast_transaction_synchronous` returns
+            once transaction is included in block, or with error response if transaction was rejected or has expired.
+        """
+        for _ in range(2):  # second attempt with fresh reference block if cached one was forked out
+            tx = self._sign_transaction(ops, keys)
+            tx_json = tx.json()
+            tracker = BroadcastTracker.get(self.endpoint, self.rpc)
+            signature = tx_json['signatures'][0] if tx_json['signatures'] else None  # e.g. no keys were given
+            try:
+                future = tracker.track(tx.id, signature, tx_json['expiration'])
+            except ValueError as e:  # node would reject duplicate, future of tracked transaction is not touched
+                future = Future()
+                future.set_result({"id": 0, "error": {"message": str(e)}})
+                return future
+            response = self.rpc.send(
+                self.json_rpc_body('call', 'network_broadcast_api', "broadcast_transaction", [tx_json]))
+            if 'error' in response:
+                tracker.resolve(tx.id, response)
+            if not is_tapos_error(response):
+                return future
+            self.ref_block.invalidate()
+        return future
+
     def broadcast_multiple_ops(self, op_name: str, data: list, users: set):
         op = getattr(operations, op_name)
         ops = [op(**d) for d in data]
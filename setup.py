@@ -14,6 +14,7 @@ required = [
     "secp256k1",
     "sortedcontainers",
     "websocket-client",
+    "websockets",
 ]
 
 setup(
@@ -95,13 +95,15 @@ def wallet_3hf(wallet):
 @pytest.fixture(scope="function")
 def opened_budgets(wallet_3hf, budget):
     budgets = []
-    for i in range(1, 4):
-        budget_cp = copy(budget)
-        update_budget_time(wallet_3hf, budget_cp, deadline=300)  # to leave all budgets opened
-        budget_cp.update({"owner": "test.test%d" % i, 'uuid': gen_uid()})
-        wallet_3hf.create_budget(**budget_cp)
+    with wallet_3hf.bulk() as bulk:
+        for i in range(1, 4):
+            budget_cp = copy(budget)
+            update_budget_time(wallet_3hf, budget_cp, deadline=300)  # to leave all budgets opened
+            budget_cp.update({"owner": "test.test%d" % i, 'uuid': gen_uid()})
+            bulk.create_budget(**budget_cp)
+            budgets.append(budget_cp)
+    for budget_cp in budgets:
         update_budget_balance(wallet_3hf, budget_cp)  # update budget params / set budget id
-        budgets.append(budget_cp)
     return budgets
 
 
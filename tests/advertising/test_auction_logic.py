@@ -39,8 +39,11 @@ def get_accounts_delta(accs_after, accs_before):
 
 
 def get_affected_balances(wallet, owners):
-    capital = wallet.get_chain_capital()
-    accounts_balances = {account['name']: account['balance'] for account in wallet.get_accounts(owners)}
+    with wallet.batch() as batch:
+        batch.get_chain_capital()
+        batch.get_accounts(owners)
+    capital, accounts = batch.results
+    accounts_balances = {account['name']: account['balance'] for account in accounts}
     return capital, accounts_balances
 
 
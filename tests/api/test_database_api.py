@@ -46,3 +46,14 @@ def test_get_config(wallet: Wallet):
         ("SCORUM_LIVE_TESTNET", bool), ("SCORUM_ADVERTISING_CASHOUT_PERIOD_SEC", int),
         ("SCORUM_BUDGETS_LIMIT_PER_OWNER", 100)
     ])
+
+
+def test_batch(wallet: Wallet):
+    with wallet.batch() as batch:
+        batch.get_config()
+        batch.get_accounts([DEFAULT_WITNESS, "alice"])
+        batch.get_block(1)
+    config, accounts, block = batch.results
+    assert config == wallet.get_config()
+    assert [a["name"] for a in accounts] == [DEFAULT_WITNESS, "alice"]
+    assert block == wallet.get_block(1)
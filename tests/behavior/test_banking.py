@@ -12,9 +12,7 @@ from tests.common import (
 def test_circulation_capital_equal_sum_accounts_balances(wallet: Wallet):
     accs_sp = Amount("0 SP")
     accs_scr = Amount("0 SCR")
-    names = wallet.list_accounts()
-    accs = wallet.get_accounts(names)
-    for acc in accs:
+    for acc in wallet.iter_accounts():
         accs_scr += Amount(acc["balance"])
         accs_sp += Amount(acc["scorumpower"])
     accs_cc = accs_scr + accs_sp
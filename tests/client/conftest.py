@@ -0,0 +1,16 @@
+import pytest
+
+from automation.fake_node import FakeNode
+from automation.wallet import Wallet
+
+
+@pytest.fixture(scope='function')
+def fake_node(genesis):
+    with FakeNode(genesis.get_accounts(), posts=10, block_interval=0.1) as n:
+        yield n
+
+
+@pytest.fixture(scope='function')
+def wallet(fake_node, genesis):
+    with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, genesis.get_accounts()) as w:
+        yield w
@@ -0,0 +1,20 @@
+import asyncio
+
+from automation.async_rpc_client import AsyncRpcClient
+from automation.wallet import Wallet
+
+
+def test_async_client_pipelining(fake_node):
+    async def fetch(names):
+        rpc = AsyncRpcClient(max_in_flight=10)
+        await rpc.open_ws(fake_node.rpc_endpoint)
+        responses = await asyncio.gather(*[rpc.send(Wallet.json_rpc_body('get_accounts', [n])) for n in names])
+        await rpc.close_ws()
+        return responses
+
+    names = ["test.test%d" % i for i in range(1, 21)]
+    loop = asyncio.new_event_loop()
+    responses = loop.run_until_complete(fetch(names))
+    loop.close()
+    assert [r["result"][0]["name"] for r in responses] == names
+    assert all(r["id"] == 0 for r in responses)
@@ -0,0 +1,23 @@
+from automation.wallet import Wallet
+from tests.common import DEFAULT_WITNESS, collect_stats
+
+
+def test_batch_results_order(wallet: Wallet):
+    with wallet.batch() as batch:
+        batch.get_accounts([DEFAULT_WITNESS])
+        batch.get_block(1, wait_for_block=True)
+        batch.get_config()
+    accounts, block, config = batch.results
+    assert accounts == wallet.get_accounts([DEFAULT_WITNESS])
+    assert block == wallet.get_block(1)
+    assert config == wallet.get_config()
+
+
+def test_batch_is_one_frame(wallet: Wallet):
+    names = ["test.test%d" % i for i in range(1, 11)]
+    with collect_stats('batch') as calls:
+        with wallet.batch() as batch:
+            for name in names:
+                batch.get_accounts([name])
+    assert calls() == 1
+    assert [accounts[0]["name"] for accounts in batch.results] == names
@@ -0,0 +1,74 @@
+import multiprocessing
+import time
+
+import websocket
+
+from automation.block_watcher import HeadBlockWatcher
+from automation.rpc_client import RpcClient
+from automation.wallet import Wallet
+
+
+def test_wait_for_block(fake_node):
+    watcher = HeadBlockWatcher.get(fake_node.rpc_endpoint)
+    assert watcher.wait(fake_node.head_block_number + 2, timeout=5)
+    assert watcher.subscribed
+    assert not watcher.wait(watcher.head_block_number + 100, timeout=0.2)
+
+
+def test_idle_watcher_stops(fake_node):
+    watcher = HeadBlockWatcher.get(fake_node.rpc_endpoint)
+    watcher.idle_timeout = 0.3
+    assert watcher.wait(1, timeout=5)
+    deadline = time.time() + 5
+    while watcher.alive and time.time() < deadline:
+        time.sleep(0.1)
+    assert not watcher.alive and watcher.error is None
+    head = watcher.head_block_number
+    time.sleep(0.5)
+    assert watcher.head_block_number == head  # node is not polled anymore
+
+    restarted = HeadBlockWatcher.get(fake_node.rpc_endpoint)
+    assert restarted is not watcher
+    assert restarted.wait(head + 1, timeout=5)
+
+
+def test_watcher_is_recreated_after_fork(fake_node):
+    watcher = HeadBlockWatcher.get(fake_node.rpc_endpoint)
+    assert watcher.wait(1, timeout=5)
+
+    def child(results):
+        forked = HeadBlockWatcher.get(fake_node.rpc_endpoint)
+        results.put((forked is not watcher, forked.wait(watcher.head_block_number + 1, timeout=5)))
+
+    results = multiprocessing.get_context('fork').Queue()
+    process = multiprocessing.get_context('fork').Process(target=child, args=(results,))
+    process.start()
+    assert results.get(timeout=10) == (True, True)
+    process.join()
+
+
+def test_watcher_uses_wallet_transport(fake_node):
+    connections = []
+
+    def transport(url):
+        connections.append(url)
+        return websocket.create_connection(url)
+
+    with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, rpc=RpcClient(transport=transport)) as w:
+        assert w.get_block(fake_node.head_block_number + 2, wait_for_block=True, time_to_wait=5)
+    assert len(connections) == 2  # wallet's and watcher's one
+
+
+def test_wallet_polls_if_watcher_is_not_connected(fake_node):
+    connections = []
+
+    def transport(url):  # only wallet's connection is allowed
+        if connections:
+            raise ConnectionRefusedError()
+        connections.append(url)
+        return websocket.create_connection(url)
+
+    with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, rpc=RpcClient(transport=transport)) as w:
+        started = time.time()
+        assert w.get_block(fake_node.head_block_number + 3, wait_for_block=True, time_to_wait=5)
+        assert time.time() - started < 3
@@ -0,0 +1,143 @@
+import itertools
+import time
+
+import pytest
+import scorum.graphenebase.operations_fabric as operations
+import websocket
+from scorum.graphenebase.amount import Amount
+from scorum.utils.time import fmt_time_from_now
+
+from automation.broadcast_tracker import BroadcastTracker
+from automation.rpc_client import RpcClient
+from automation.signing import MAX_TIME_UNTIL_EXPIRATION, sign_transactions
+from automation.wallet import Wallet
+from tests.common import DEFAULT_WITNESS
+
+
+def transfer(wallet, _from, to, amount):
+    op = operations.transfer_operation(_from, to, Amount(amount), "")
+    return wallet.broadcast_transaction([op], [wallet.account(_from).get_active_private()])
+
+
+def test_broadcast_transaction_futures(wallet: Wallet):
+    names = ["test.test%d" % i for i in range(1, 11)]
+    futures = [transfer(wallet, DEFAULT_WITNESS, name, "1.000000000 SCR") for name in names]
+    results = [f.result(timeout=10) for f in futures]
+    assert all('block_num' in r for r in results), results
+    assert len({r['id'] for r in results}) == len(names)
+    for name in names:
+        assert wallet.get_account(name)['balance'] == "101.000000000 SCR"
+
+
+def test_rejected_transaction_is_resolved(wallet: Wallet):
+    future = transfer(wallet, "test.test1", DEFAULT_WITNESS, "1000.000000000 SCR")
+    assert 'error' in future.result(timeout=1)
+
+
+def test_duplicate_transaction_does_not_fail_tracked_one(wallet: Wallet):
+    first = transfer(wallet, DEFAULT_WITNESS, "test.test1", "1.000000000 SCR")
+    second = transfer(wallet, DEFAULT_WITNESS, "test.test1", "1.000000000 SCR")  # the same id within a second
+    assert first is not second
+    assert 'block_num' in first.result(timeout=10)
+    result = second.result(timeout=10)
+    assert 'block_num' in result or 'already broadcast' in str(result)
+
+
+def test_bulk_packs_operations(wallet: Wallet):
+    names = ["test.test%d" % i for i in range(1, 11)]
+    with wallet.bulk(max_ops=4) as bulk:
+        for name in names:
+            bulk.transfer(DEFAULT_WITNESS, name, Amount("1.000000000 SCR"))
+        bulk.transfer("test.test1", "test.test2", Amount("1.000000000 SCR"))
+        transactions = bulk.pack()
+    assert [len(ops) for ops, _ in transactions] == [4, 4, 3]
+    assert [len(keys) for _, keys in transactions] == [1, 1, 2]
+    assert len(bulk.results) == 3
+    assert all('block_num' in r for r in bulk.results), bulk.results
+    assert wallet.get_account("test.test1")['balance'] == "100.000000000 SCR"
+    assert wallet.get_account("test.test2")['balance'] == "102.000000000 SCR"
+
+
+def test_bulk_separates_posting_operations(wallet: Wallet):
+    bulk = wallet.bulk()
+    bulk.transfer(DEFAULT_WITNESS, "test.test1", Amount("1.000000000 SCR"))
+    bulk.transfer(DEFAULT_WITNESS, "test.test2", Amount("1.000000000 SCR"))
+    bulk.vote("test.test1", DEFAULT_WITNESS, "post")
+    bulk.transfer(DEFAULT_WITNESS, "test.test3", Amount("1.000000000 SCR"))
+    transactions = bulk.pack()
+    assert [[op.json()[0] for op in ops] for ops, _ in transactions] == [
+        ["transfer", "transfer"], ["vote"], ["transfer"]
+    ]
+
+
+def test_broadcast_unsigned_transaction(wallet: Wallet):
+    op = operations.transfer_operation(DEFAULT_WITNESS, "test.test1", Amount("1.000000000 SCR"), "")
+    result = wallet.broadcast_transaction([op]).result(timeout=10)
+    assert 'block_num' in result, result
+
+
+def test_tracker_uses_wallet_transport(fake_node, genesis):
+    connections = []
+
+    def transport(url):
+        connections.append(url)
+        return websocket.create_connection(url)
+
+    rpc = RpcClient(transport=transport)
+    with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, genesis.get_accounts(), rpc=rpc) as w:
+        assert 'block_num' in transfer(w, DEFAULT_WITNESS, "test.test1", "1.000000000 SCR").result(timeout=10)
+    assert len(connections) == 3  # wallet's, tracker's and watcher's one
+
+
+def test_idle_tracker_stops(wallet: Wallet):
+    tracker = BroadcastTracker.get(wallet.endpoint)
+    tracker.idle_timeout = 0.3
+    assert 'block_num' in transfer(wallet, DEFAULT_WITNESS, "test.test1", "1.000000000 SCR").result(timeout=10)
+    deadline = time.time() + 5
+    while tracker.alive and time.time() < deadline:
+        time.sleep(0.1)
+    assert not tracker.alive and tracker.error is None
+    assert 'block_num' in transfer(wallet, DEFAULT_WITNESS, "test.test2", "1.000000000 SCR").result(timeout=10)
+    assert BroadcastTracker.get(wallet.endpoint) is not tracker
+
+
+def test_sign_transactions(wallet: Wallet):
+    names = ["test.test%d" % i for i in range(1, 21)]
+    key = wallet.account(DEFAULT_WITNESS).get_active_private()
+    transactions = (
+        ([operations.transfer_operation(DEFAULT_WITNESS, name, Amount("1.000000000 SCR"), "")], [key])
+        for name in names
+    )
+    signed = list(wallet.sign_transactions(transactions, processes=2))
+    assert [tx['operations'][0][1]['to'] for tx in signed] == names
+    for tx in signed:
+        response = wallet.rpc.send(
+            wallet.json_rpc_body('call', 'network_broadcast_api', 'broadcast_transaction_synchronous', [tx])
+        )
+        assert 'result' in response, response
+    assert wallet.get_account(names[-1])['balance'] == "101.000000000 SCR"
+
+
+def test_sign_transactions_lazily(wallet: Wallet):
+    key = wallet.account(DEFAULT_WITNESS).get_active_private()
+    transactions = (
+        ([operations.transfer_operation(DEFAULT_WITNESS, "test.test%d" % i, Amount("1.000000000 SCR"), "")], [key])
+        for i in itertools.count()
+    )
+    signed = list(itertools.islice(wallet.sign_transactions(transactions, processes=2), 100))
+    assert [tx['operations'][0][1]['to'] for tx in signed] == ["test.test%d" % i for i in range(100)]
+
+
+def test_sign_transactions_expiration_limit(wallet: Wallet):
+    key = wallet.account(DEFAULT_WITNESS).get_active_private()
+    op = operations.transfer_operation(DEFAULT_WITNESS, "test.test1", Amount("1.000000000 SCR"), "")
+    with pytest.raises(ValueError):
+        wallet.sign_transactions([([op], [key])], expiration=MAX_TIME_UNTIL_EXPIRATION + 1)
+
+    ref_block_num, ref_block_prefix = wallet.ref_block.get(wallet.get_dynamic_global_properties)
+    expiration = fmt_time_from_now(2 * MAX_TIME_UNTIL_EXPIRATION)
+    tx, = sign_transactions([([op], [key])], wallet.chain_id, ref_block_num, ref_block_prefix, expiration, processes=1)
+    response = wallet.rpc.send(
+        wallet.json_rpc_body('call', 'network_broadcast_api', 'broadcast_transaction_synchronous', [tx])
+    )
+    assert 'SCORUM_MAX_TIME_UNTIL_EXPIRATION' in response['error']['message'], response
@@ -0,0 +1,46 @@
+import websocket
+
+from automation.cassette import Cassette, RecordingTransport, replaying
+from automation.fake_node import FakeNode
+from automation.rpc_client import RpcClient
+from automation.wallet import Wallet
+from tests.common import DEFAULT_WITNESS
+
+
+def test_record_replay(fake_node, tmpdir):
+    path = str(tmpdir.join("cassette.gz"))
+    cassette = Cassette(path)
+
+    def transport(url):
+        return RecordingTransport(websocket.create_connection(url), cassette, url)
+
+    with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, rpc=RpcClient(transport=transport)) as w:
+        recorded = [w.get_accounts([DEFAULT_WITNESS]), w.get_config()]
+    cassette.close()
+    fake_node.stop()
+
+    with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, rpc=RpcClient(transport=replaying(path))) as w:
+        assert [w.get_accounts([DEFAULT_WITNESS]), w.get_config()] == recorded
+
+
+def test_replay_matches_endpoint(fake_node, genesis, tmpdir):
+    path = str(tmpdir.join("cassette.gz"))
+    cassette = Cassette(path)
+
+    def transport(url):
+        return RecordingTransport(websocket.create_connection(url), cassette, url)
+
+    other_node = FakeNode([a for a in genesis.get_accounts() if a.name != DEFAULT_WITNESS])
+    other_node.start()
+    endpoints = [fake_node.rpc_endpoint, other_node.rpc_endpoint]
+    recorded = []
+    for endpoint in endpoints:
+        with Wallet(fake_node.chain_id, endpoint, rpc=RpcClient(transport=transport)) as w:
+            recorded.append(w.get_accounts([DEFAULT_WITNESS]))
+    cassette.close()
+    other_node.stop()
+    assert recorded[0] != recorded[1]
+
+    for endpoint, expected in reversed(list(zip(endpoints, recorded))):
+        with Wallet(fake_node.chain_id, endpoint, rpc=RpcClient(transport=replaying(path))) as w:
+            assert w.get_accounts([DEFAULT_WITNESS]) == expected
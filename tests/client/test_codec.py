@@ -0,0 +1,26 @@
+import pytest
+
+from automation.codec import JsonCodec, OrjsonCodec, available_codecs, get_codec
+from automation.rpc_client import request_frame
+
+FRAME = {"jsonrpc": "2.0", "id": 0, "method": "call", "params": ["database_api", "get_accounts", [["тест"]]]}
+
+
+@pytest.mark.parametrize('codec', available_codecs(), ids=lambda c: c.name)
+def test_round_trip(codec):
+    assert codec.decode(codec.encode(FRAME)) == FRAME
+    assert codec.decode(codec.encode(FRAME).decode('utf8')) == FRAME
+    assert codec.decode(request_frame(FRAME, codec)) == FRAME
+
+
+def test_orjson_encodes_out_of_range_integers():
+    pytest.importorskip('orjson')
+    body = {"id": 0, "result": 2 ** 64}
+    assert JsonCodec().decode(OrjsonCodec().encode(body)) == body
+
+
+def test_get_codec():
+    assert get_codec('json').name == 'json'
+    assert get_codec().name == available_codecs()[0].name
+    with pytest.raises(ValueError):
+        get_codec('unknown')
@@ -0,0 +1,35 @@
+import websocket
+
+from automation.connection_pool import ConnectionPool
+from automation.rpc_client import RpcClient
+from automation.wallet import Wallet
+
+
+def test_pool_reuses_connection(fake_node):
+    pool = ConnectionPool()
+    with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, pool=pool) as w:
+        rpc = w.rpc
+    with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, pool=pool) as w:
+        assert w.rpc is rpc
+        assert w.get_config()
+    assert w.rpc is None  # connection is back in the pool
+    pool.clear()
+
+
+def test_pool_keeps_client_transport(fake_node):
+    connections = []
+
+    def transport(url):
+        connections.append(url)
+        return websocket.create_connection(url)
+
+    pool = ConnectionPool()
+    with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, pool=pool) as w:
+        plain = w.rpc
+    for _ in range(2):
+        with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, pool=pool, rpc=RpcClient(transport=transport)) as w:
+            assert w.rpc is not plain
+            assert w.rpc.transport is transport
+            assert w.get_config()
+    assert len(connections) == 1
+    pool.clear()
@@ -0,0 +1,68 @@
+import io
+from hashlib import sha256
+
+from automation.account import Account
+from automation.genesis import Genesis
+from automation.keyring import derive_key_pairs
+
+
+def test_genesis_accounts():
+    genesis = Genesis()
+    genesis.add_account("alice", "10.000000000 SCR")
+    genesis.add_account(Account("bob"))
+    genesis.add_account("alice", "20.000000000 SCR")  # already added account is not replaced
+
+    assert [(ga.account.name, str(ga.amount)) for ga in genesis.genesis_accounts] == [
+        ("alice", "10.000000000 SCR"), ("bob", "100.000000000 SCR")
+    ]
+    assert genesis.get_account("bob") is genesis.get_account(Account("bob"))
+    assert genesis.get_account("carol") is None
+    assert genesis.has_account("alice") and genesis.has_account(Account("alice"))
+    assert not genesis.has_account("carol")
+
+    genesis.add_witness_acc("carol")
+    genesis.add_founder_acc("alice", 100.0)
+    assert genesis.witness_candidates == [] and genesis.founders == {("alice", 100.0)}
+
+
+def test_write_genesis():
+    genesis = Genesis()
+    for name in ["alice", "bob", "carol"]:
+        genesis.add_account(name)
+    genesis.add_witness_acc("alice")
+    genesis.add_founder_acc("bob", 100.0)
+    genesis.add_steemit_bounty_acc("alice")
+    genesis.add_steemit_bounty_acc("carol")
+    genesis.add_reg_committee_acc("alice")
+    genesis.add_dev_committee_acc("alice")
+
+    fp = io.StringIO()
+    chain_id = genesis.write(fp)
+    genesis.calculate_supplies()
+    assert fp.getvalue() == genesis.dump()
+    assert chain_id == sha256(genesis.dump().encode()).hexdigest()
+    assert genesis['accounts_supply'] == "300.000000000 SCR"
+    assert len(genesis['accounts']) == 3
+
+    genesis.calculate_supplies()  # supplies are not accumulated on repeated calculation
+    assert genesis['accounts_supply'] == "300.000000000 SCR"
+    assert len(genesis['accounts']) == 3
+
+
+def test_add_accounts_in_bulk():
+    names = ["bulk.%d" % i for i in range(300)]
+    pairs = derive_key_pairs(names[:10], processes=2, chunksize=2)
+    assert len(pairs) == 10
+    assert list(pairs) == [(Account(n).get_owner_public(), Account(n).get_owner_private()) for n in names[:10]]
+
+    genesis = Genesis()
+    genesis.add_account("bulk.0", "1.000000000 SCR")
+    genesis.add_accounts(names + names[:5], processes=2)
+    genesis.add_witness_accs(["bulk.1", "bulk.2", "missing"])
+
+    assert len(genesis.get_accounts()) == 300
+    assert str(genesis.genesis_accounts[0].amount) == "1.000000000 SCR"
+    account = genesis.get_account("bulk.299")
+    assert account.get_owner_public() == Account("bulk.299").get_owner_public()
+    assert [a.name for a in genesis.witness_candidates] == ["bulk.1", "bulk.2"]
+    assert genesis.witness_candidates[0].get_signing_private() == Account("bulk.1").get_signing_private()
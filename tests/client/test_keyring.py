@@ -0,0 +1,58 @@
+import pytest
+
+import automation.account
+from automation.account import Account, _key_pair
+from automation.keyring import Keyring
+
+
+def test_keyring_is_persistent(tmpdir):
+    path = str(tmpdir.join("keys"))
+    keyring = Keyring()
+    keyring.enable(path, save_at_exit=False)
+    assert keyring.populate(["alice", "bob"], roles=('owner', 'signing')) == 4
+    assert keyring.populate(["alice"]) == 0
+    keyring.save()
+
+    other = Keyring()
+    other.enable(path, save_at_exit=False)
+    assert other.size == 4
+    assert other.get("alice", "alice", "owner") == keyring.get("alice", "alice", "owner")
+    assert other.get("alice", "password", "owner") is None
+
+    other.populate(["carol"])
+    keyring.populate(["dave"])
+    other.save()
+    keyring.save()  # keys saved by other keyring are kept
+    other.enable(path, save_at_exit=False)
+    assert other.size == 6
+    for name in ["alice", "bob", "carol", "dave"]:
+        assert other.get(name, name, "owner")
+
+
+def test_disabled_keyring_is_not_populated():
+    with pytest.raises(RuntimeError):
+        Keyring().populate(["alice"])
+
+
+@pytest.fixture
+def keyring(tmpdir, monkeypatch):
+    keyring = Keyring()
+    keyring.enable(str(tmpdir.join("keys")), save_at_exit=False)
+    monkeypatch.setattr(automation.account, "KEYRING", keyring)
+    _key_pair.cache_clear()
+    yield keyring
+    _key_pair.cache_clear()  # keys read from test keyring should not leak to other tests
+
+
+def test_account_uses_keyring(keyring):
+    keyring.add("keyring.test", "keyring.test", "owner", "SCR_public", "private")
+    assert Account("keyring.test").get_owner_public() == "SCR_public"
+
+    account = Account("keyring.test2")
+    keyring.save()
+    assert keyring.get("keyring.test2", "keyring.test2", "owner") is None  # keys are derived lazily
+    account.get_owner_private()
+    keyring.save()
+    assert keyring.get("keyring.test2", "keyring.test2", "owner") == (
+        account.get_owner_public(), account.get_owner_private()
+    )
@@ -0,0 +1,39 @@
+from scorum.graphenebase.amount import Amount
+
+from automation.ref_block import RefBlockProvider, is_tapos_error, ref_block_params
+from automation.wallet import Wallet
+from tests.common import DEFAULT_WITNESS, collect_stats
+
+PROPS = {"head_block_number": 0x10002, "head_block_id": "00010002c0ffee00000000000000000000000000"}
+
+
+def test_ref_block_params():
+    assert ref_block_params(PROPS) == (0x0002, 0x00eeffc0)
+
+
+def test_provider_reuses_block_until_invalidated():
+    calls = []
+
+    def get_props():
+        calls.append(1)
+        return PROPS
+
+    provider = RefBlockProvider(max_age=60)
+    assert provider.get(get_props) == provider.get(get_props)
+    assert len(calls) == 1
+    provider.invalidate()
+    provider.get(get_props)
+    assert len(calls) == 2
+
+
+def test_is_tapos_error():
+    assert is_tapos_error({"id": 0, "error": {"message": "transaction tapos exception"}})
+    assert not is_tapos_error({"id": 0, "error": {"message": "Missing Active Authority"}})
+    assert not is_tapos_error({"id": 0, "result": {}})
+
+
+def test_broadcasts_share_ref_block(wallet: Wallet):
+    with collect_stats('database_api.get_dynamic_global_properties') as calls:
+        for _ in range(3):
+            wallet.transfer(DEFAULT_WITNESS, "test.test1", Amount("1.000000000 SCR"))
+    assert calls() == 1
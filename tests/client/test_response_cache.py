@@ -0,0 +1,46 @@
+from automation.fake_node import FakeNode
+from automation.response_cache import ResponseCache
+from automation.wallet import Wallet
+from tests.common import collect_stats
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_size=2)
+    cache.put(('get_block', 1), {"previous": "1"})
+    cache.put(('get_block', 2), {"previous": "2"})
+    assert cache.get(('get_block', 1)) == {"previous": "1"}
+    cache.put(('get_block', 3), {"previous": "3"})
+    assert cache.get(('get_block', 2)) is None
+    assert cache.get(('get_block', 1)) == {"previous": "1"}
+
+
+def test_results_are_copied():
+    cache = ResponseCache()
+    cache.put(('get_config',), {"SCORUM_BLOCK_INTERVAL": 3})
+    cache.get(('get_config',))["SCORUM_BLOCK_INTERVAL"] = 1
+    assert cache.get(('get_config',)) == {"SCORUM_BLOCK_INTERVAL": 3}
+
+
+def test_lib_going_backwards_drops_results():
+    cache = ResponseCache()
+    cache.update_lib(10)
+    cache.put(('get_block', 5), {"previous": "5"})
+    cache.update_lib(12)
+    assert cache.get(('get_block', 5))
+    cache.update_lib(3)
+    assert cache.get(('get_block', 5)) is None
+
+
+def test_irreversible_blocks_are_cached(genesis):
+    with FakeNode(genesis.get_accounts(), block_interval=0) as node:  # blocks are produced only by the test
+        node.produce_block()
+        head = node.produce_block()
+        with Wallet(node.chain_id, node.rpc_endpoint, genesis.get_accounts(), cache=ResponseCache()) as w:
+            with collect_stats('blockchain_history_api.get_block') as calls:
+                first = [w.get_block(num) for num in (1, head)]
+                second = [w.get_block(num) for num in (1, head)]
+            assert first == second
+            assert calls() == 3  # head block is reversible
+            with collect_stats('database_api.get_config') as calls:
+                assert w.get_config() == w.get_config()
+            assert calls() == 1
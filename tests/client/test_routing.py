@@ -0,0 +1,82 @@
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from automation.fake_node import FakeNode
+from automation.routing_rpc_client import RoutingRpcClient
+from automation.wallet import Wallet
+from tests.common import DEFAULT_WITNESS
+
+
+def free_endpoint():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return "127.0.0.1:%d" % s.getsockname()[1]
+
+
+@pytest.fixture(scope='function')
+def readers(genesis):
+    nodes = [FakeNode(genesis.get_accounts(), block_interval=0) for _ in range(2)]
+    for n in nodes:
+        n.start()
+    yield nodes
+    for n in nodes:
+        n.stop()
+
+
+def test_reads_are_spread(readers, fake_node, genesis):
+    rpc = RoutingRpcClient([n.rpc_endpoint for n in readers])
+    with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, genesis.get_accounts(), rpc=rpc) as w:
+        requests_before = [n.requests for n in readers]
+        for _ in range(50):
+            w.get_accounts([DEFAULT_WITNESS])
+        assert all(n.requests > before for n, before in zip(readers, requests_before))
+
+        writer_requests = fake_node.requests
+        response = w.transfer(DEFAULT_WITNESS, "test.test1", "1.000000000 SCR")
+        assert 'block_num' in response
+        assert fake_node.requests > writer_requests
+
+
+def test_failed_reader_is_ejected(readers, fake_node, genesis):
+    rpc = RoutingRpcClient([n.rpc_endpoint for n in readers] + [free_endpoint()], min_backoff=0.1,
+                           max_backoff=0.2)
+    with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, genesis.get_accounts(), rpc=rpc) as w:
+        readers[0].stop()
+        for _ in range(20):
+            assert w.get_config()
+        readers[0].start()
+        time.sleep(0.2)  # reader is reconnected after backoff
+        requests_before = readers[0].requests
+        for _ in range(100):
+            w.get_config()
+        assert readers[0].requests > requests_before
+
+
+def test_concurrent_reads_survive_ejection(readers, fake_node, genesis):
+    rpc = RoutingRpcClient([n.rpc_endpoint for n in readers], min_backoff=0.05, max_backoff=0.1)
+    with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, genesis.get_accounts(), rpc=rpc) as w:
+        def read(i):
+            if i == 50:
+                readers[0].stop()
+            return w.get_config()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert all(executor.map(read, range(200)))
+
+
+def test_all_readers_failed(fake_node):
+    rpc = RoutingRpcClient([free_endpoint()], connect_timeout=0.1)
+    with pytest.raises(ConnectionError):
+        rpc.open_ws(fake_node.rpc_endpoint)
+    rpc.close_ws()
+
+
+def test_clone_has_the_same_endpoints():
+    rpc = RoutingRpcClient(["127.0.0.1:1", "127.0.0.1:2"], writer="127.0.0.1:3", connect_timeout=0.5)
+    clone = rpc.clone()
+    assert [r.addr for r in clone.readers] == ["127.0.0.1:1", "127.0.0.1:2"]
+    assert clone.writer.addr == "127.0.0.1:3" and clone.connect_timeout == 0.5
+    assert clone.writer is not rpc.writer
@@ -0,0 +1,80 @@
+import asyncio
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from automation.async_rpc_client import AsyncRpcClient
+from automation.fake_node import FakeNode
+from automation.codec import JsonCodec
+from automation.rpc_client import RpcClient, is_read_request
+from automation.wallet import Wallet
+from tests.common import collect_stats
+
+
+def test_open_ws_waits_for_node(genesis):
+    node = FakeNode(genesis.get_accounts())
+    with socket.socket() as s:
+        s.bind((node.host, 0))
+        node.port = s.getsockname()[1]
+    threading.Timer(0.3, node.start).start()
+    rpc = RpcClient()
+    try:
+        rpc.open_ws(node.rpc_endpoint, timeout=10)
+        assert 'result' in rpc.send(Wallet.json_rpc_body('get_config'))
+    finally:
+        rpc.close_ws()
+        node.stop()
+
+
+def test_open_ws_deadline():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    started = time.time()
+    with pytest.raises(TimeoutError):
+        RpcClient().open_ws("127.0.0.1:%d" % port, timeout=0.5)
+    assert time.time() - started < 2
+
+
+def test_concurrent_reads_are_coalesced(fake_node):
+    rpc = RpcClient()
+    rpc.open_ws(fake_node.rpc_endpoint)
+    request = Wallet.json_rpc_body('get_dynamic_global_properties', api='database_api')
+    fake_node.latency = 0.2
+    with collect_stats('database_api.get_dynamic_global_properties') as calls:
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            responses = list(executor.map(lambda _: rpc.send(request), range(20)))
+    rpc.close_ws()
+
+    assert all(r == responses[0] for r in responses)
+    assert len({id(r) for r in responses}) == len(responses)
+    assert calls() < len(responses)
+
+
+def test_read_request_classification():
+    assert is_read_request(Wallet.json_rpc_body('call', 'database_api', 'get_config', []))
+    assert is_read_request(Wallet.json_rpc_body('get_block', 1, api='blockchain_history_api'))
+    assert not is_read_request(Wallet.json_rpc_body('call', 'network_broadcast_api', 'broadcast_transaction', []))
+    assert not is_read_request(Wallet.json_rpc_body('set_block_applied_callback', 1, api='database_api'))
+    assert not is_read_request(bytes(Wallet.json_rpc_body('get_config', api='database_api')))  # method is unknown
+    assert JsonCodec().decode(Wallet.json_rpc_body('get_config', api='database_api'))['params'][1] == 'get_config'
+
+
+def test_async_concurrent_reads_are_coalesced(fake_node):
+    async def fetch(request, count):
+        rpc = AsyncRpcClient()
+        await rpc.open_ws(fake_node.rpc_endpoint)
+        responses = await asyncio.gather(*[rpc.send(request) for _ in range(count)])
+        await rpc.close_ws()
+        return responses
+
+    request = Wallet.json_rpc_body('get_config', api='database_api')
+    loop = asyncio.new_event_loop()
+    with collect_stats('database_api.get_config') as calls:
+        responses = loop.run_until_complete(fetch(request, 10))
+    loop.close()
+    assert all(r == responses[0] for r in responses)
+    assert calls() == 1
@@ -0,0 +1,40 @@
+import json
+
+from automation.rpc_client import RpcClient
+from automation.rpc_stats import STATS, RpcStats, rpc_method_name
+from automation.wallet import Wallet
+from tests.common import collect_stats
+
+
+def test_method_name():
+    assert rpc_method_name(Wallet.json_rpc_body('call', 'database_api', 'get_config', [])) == 'database_api.get_config'
+    assert rpc_method_name(json.dumps({"method": "get_block", "params": [1]})) == 'get_block'
+    assert rpc_method_name(b'[{"method": "get_block", "params": [1]}]') == 'batch'
+
+
+def test_record(tmpdir):
+    stats = RpcStats()
+    request = Wallet.json_rpc_body('get_config', api='database_api')
+    stats.record(request, 0.002, 100, 1000)
+    stats.record(request, 0.2, 100, 3000, error=True)
+    method = stats.as_dict()['database_api.get_config']
+    assert method['calls'] == 2
+    assert method['errors'] == 1
+    assert method['latency']['min'] == 0.002 and method['latency']['max'] == 0.2
+    assert method['latency']['histogram']['<=0.0025'] == 1 and method['latency']['histogram']['<=0.25'] == 1
+    assert method['response_bytes'] == {"total": 4000, "max": 3000}
+
+    path = str(tmpdir.join("stats.json"))
+    stats.dump(path)
+    with open(path) as f:
+        assert json.load(f) == stats.as_dict()
+
+
+def test_client_records_calls(fake_node):
+    rpc = RpcClient()
+    rpc.open_ws(fake_node.rpc_endpoint)
+    with collect_stats('database_api.get_config') as calls:
+        rpc.send(Wallet.json_rpc_body('get_config', api='database_api'))
+    rpc.close_ws()
+    assert calls() == 1
+    assert STATS.as_dict()['database_api.get_config']['request_bytes']['max'] > 0
@@ -0,0 +1,100 @@
+import pytest
+import websocket
+from scorum.graphenebase.amount import Amount
+
+from automation.account import Account
+from automation.prefetch import prefetch
+from automation.rpc_client import RpcClient
+from automation.wallet import Wallet
+from tests.common import DEFAULT_WITNESS
+
+
+def test_account_lookup():
+    wallet = Wallet("0" * 64, "127.0.0.1:8090", [Account("alice")])
+    wallet.add_account("bob")
+    wallet.add_accounts(Account("test.test%d" % i) for i in range(1, 4))
+    assert [a.name for a in wallet.accounts] == ["alice", "bob", "test.test1", "test.test2", "test.test3"]
+    assert wallet.account("test.test2").name == "test.test2"
+    assert wallet.account("unknown") is None
+
+
+def test_account_keys_are_derived_once():
+    alice = Account('alice')
+    assert alice.get_owner_public() is Account('alice').get_owner_public()
+    assert alice.get_owner_private() is Account('alice').get_owner_private()
+    assert alice.get_owner_public() != Account('alice', 'password').get_owner_public()
+    assert alice.owner is not alice.posting
+
+
+def test_accounts_are_not_shared():
+    Wallet("0" * 64, "127.0.0.1:8090").add_account("alice")
+    assert Wallet("0" * 64, "127.0.0.1:8090").accounts == []
+
+
+def test_iter_account_names(wallet: Wallet, genesis):
+    names = sorted(a.name for a in genesis.get_accounts())
+    assert list(wallet.iter_account_names(page_size=7)) == names
+    assert wallet.list_all_accounts() == names
+
+
+def test_iter_accounts(wallet: Wallet, genesis):
+    names = sorted(a.name for a in genesis.get_accounts())
+    assert [a["name"] for a in wallet.iter_accounts(chunk_size=4)] == names
+    assert [a["name"] for a in wallet.iter_accounts(names[:5], chunk_size=2)] == names[:5]
+
+
+def test_prefetch():
+    def items():
+        yield 1
+        yield 2
+        raise KeyError("3")
+
+    it = prefetch(items())
+    assert [next(it), next(it)] == [1, 2]
+    with pytest.raises(KeyError):
+        next(it)
+
+
+def test_iter_account_history(wallet: Wallet):
+    for i in range(1, 6):
+        wallet.transfer(DEFAULT_WITNESS, "test.test%d" % i, Amount("1.000000000 SCR"))
+    history = wallet.get_account_history(DEFAULT_WITNESS, -1, 1000)
+    assert len(history) < 1000
+    walked = list(wallet.iter_account_history(DEFAULT_WITNESS, page_size=3))
+    assert walked == sorted(history, key=lambda i: i[0], reverse=True)
+
+    transfers = list(wallet.iter_account_history(DEFAULT_WITNESS, page_size=3, op_types={'transfer'}))
+    assert [i[1]['op'][1]['to'] for i in transfers] == ["test.test%d" % i for i in range(5, 0, -1)]
+
+
+def test_iter_ops_history(wallet: Wallet):
+    wallet.get_block(10, wait_for_block=True)
+    ids = [i[0] for i in wallet.iter_ops_history(page_size=4)]
+    assert ids == list(range(ids[0], -1, -1))
+
+
+def test_get_blocks(wallet: Wallet):
+    wallet.get_block(30, wait_for_block=True)
+    blocks = list(wallet.get_blocks(1, 30, connections=3, batch_size=4))
+    assert [num for num, _ in blocks] == list(range(1, 31))
+    assert [block for _, block in blocks] == [wallet.get_block(num) for num in range(1, 31)]
+    assert list(wallet.get_blocks(10**6, 10**6)) == [(10**6, None)]
+
+
+def test_get_blocks_uses_wallet_transport(fake_node):
+    urls = []
+
+    def transport(url):
+        urls.append(url)
+        return websocket.create_connection(url)
+
+    with Wallet(fake_node.chain_id, fake_node.rpc_endpoint, rpc=RpcClient(transport=transport)) as w:
+        w.get_block(20, wait_for_block=True)
+        assert len(list(w.get_blocks(1, 20, connections=3, batch_size=2))) == 20
+    assert len(urls) > 1
+
+
+def test_get_ops_in_blocks(wallet: Wallet):
+    wallet.get_block(10, wait_for_block=True)
+    ops = list(wallet.get_ops_in_blocks(1, 10, connections=2, batch_size=3))
+    assert ops == [(num, wallet.get_ops_in_block(num)) for num in range(1, 11)]
@@ -2,10 +2,13 @@ import os
 import re
 import time
 import uuid
+from contextlib import contextmanager
 from functools import partial
 from multiprocessing import Pool
 
 from delayed_assert import expect, assert_expectations
+from automation.connection_pool import POOL
+from automation.rpc_stats import STATS
 from automation.wallet import Wallet
 
 DEFAULT_WITNESS = "initdelegate"
@@ -51,12 +54,29 @@ def check_file_creation(filepath, sec=5):
         "File wasn't created after %d seconds. Path %s" % (sec, filepath)
 
 
+@contextmanager
+def collect_stats(method):
+    """
+    :return callable: Number of `method` calls made inside of the context.
+    """
+    enabled = STATS.enabled
+
+    def count():
+        return STATS.as_dict().get(method, {}).get('calls', 0)
+
+    before = count()
+    STATS.enable()
+    try:
+        yield lambda: count() - before
+    finally:
+        STATS.enabled = enabled
+
+
 def check_virt_ops(wallet, start, stop, expected_ops):
     expected_ops = set(expected_ops)
     ops = set()
     data = []
-    for i in range(start, stop + 1):
-        response = wallet.get_ops_in_block(i)
+    for _, response in wallet.get_ops_in_blocks(start, stop):
         if response and 'error' not in response:
             ops.update(set(d['op'][0] for _, d in response))
             data += [d['op'] for _, d in response]
@@ -98,10 +118,7 @@ def generate_blocks(node, docker, num=1):
 
 
 def post_comment(post_kwargs, node):
-    with Wallet(node.get_chain_id(), node.rpc_endpoint, node.genesis.get_accounts()) as w:
-        w.login("", "")
-        w.get_api_by_name('database_api')
-        w.get_api_by_name('network_broadcast_api')
+    with Wallet(node.get_chain_id(), node.rpc_endpoint, node.genesis.get_accounts(), pool=POOL) as w:
         return w.post_comment(**post_kwargs)
 
 
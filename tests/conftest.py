@@ -1,3 +1,4 @@
+import os
 from os.path import join, isfile
 
 from scorum.utils.files import which, remove_dir_tree, create_dir
@@ -6,8 +7,11 @@ from automation.config import Config
 from automation.docker_controller import DEFAULT_IMAGE_NAME
 from automation.docker_controller import DockerController
 from automation.genesis import Genesis
+from automation.keyring import KEYRING
 from automation.node import Node
 from automation.node import TEST_TEMP_DIR
+from automation.response_cache import ResponseCache
+from automation.rpc_stats import STATS
 from automation.wallet import Wallet
 from tests.common import check_file_creation
 from tests.data import *
@@ -23,6 +27,34 @@ def pytest_addoption(parser):
         '--long-term', action='store_true',
         help='Include long-term tests. Could take significantly long time.'
     )
+    parser.addoption(
+        '--rpc-stats', action='store', default=None,
+        help='Collect per-method RPC latency and payload stats and write them as json to specified path.'
+    )
+    parser.addoption(
+        '--keyring', action='store', default=None,
+        help='Read derived account keys from specified keyring file and save new ones to it.'
+    )
+
+
+def pytest_configure(config):
+    if config.getoption('--rpc-stats'):
+        STATS.enable()
+    if config.getoption('--keyring'):
+        KEYRING.enable(config.getoption('--keyring'), save_at_exit=False)
+
+
+def pytest_sessionfinish(session):
+    KEYRING.save()
+    path = session.config.getoption('--rpc-stats')
+    if not path:
+        return
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+    if worker:  # each xdist worker collects own stats
+        path = "{path}.{worker}".format(path=path, worker=worker)
+    elif session.config.pluginmanager.hasplugin('dsession'):
+        return  # xdist controller runs no tests, stats are in workers' files
+    STATS.dump(path)
 
 
 @pytest.fixture(autouse=True)
@@ -180,11 +212,23 @@ def docker(image, bin_path, rebuild_image):
     yield d
 
 
-@pytest.fixture(scope='function')
-def wallet(node):
-    with Wallet(node.get_chain_id(), node.rpc_endpoint, node.genesis.get_accounts()) as w:
+def _wallet(node, cache=None):
+    with Wallet(node.get_chain_id(), node.rpc_endpoint, node.genesis.get_accounts(), cache=cache) as w:
         w.login("", "")
         w.get_api_by_name('database_api')
         w.get_api_by_name('network_broadcast_api')
         w.get_block(1, wait_for_block=True)
         yield w
+
+
+@pytest.fixture(scope='function')
+def wallet(node):
+    yield from _wallet(node)
+
+
+@pytest.fixture(scope='function')
+def cached_wallet(node):
+    """
+    Wallet caching immutable chain reads, for tests which read many old blocks.
+    """
+    yield from _wallet(node, ResponseCache())
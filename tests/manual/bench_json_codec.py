@@ -0,0 +1,88 @@
+"""
+Compares installed JSON codecs on recorded RPC payloads.
+
+Record payloads from a node (e.g. mainnet one), each response frame is saved as is:
+    python tests/manual/bench_json_codec.py record localhost:8091 payloads --block 3902818
+
+Run benchmark:
+    python tests/manual/bench_json_codec.py run payloads/*.json
+"""
+import argparse
+import logging
+import os
+import time
+
+import websocket
+
+from automation.codec import available_codecs
+from automation.wallet import Wallet
+
+
+def record(address, directory, block):
+    requests = {
+        "get_posts_and_comments": Wallet.json_rpc_body(
+            'call', 'tags_api', 'get_posts_and_comments', [{"limit": 100}]
+        ),
+        "get_ops_in_block": Wallet.json_rpc_body('call', 'blockchain_history_api', 'get_ops_in_block', [block, 0]),
+        "get_block": Wallet.json_rpc_body('get_block', block, api='blockchain_history_api'),
+        "get_chain_capital": Wallet.json_rpc_body('call', 'chain_api', 'get_chain_capital', []),
+    }
+    os.makedirs(directory, exist_ok=True)
+    ws = websocket.create_connection("ws://{addr}".format(addr=address))
+    try:
+        for name, request in requests.items():
+            ws.send(request)
+            path = os.path.join(directory, "%s.json" % name)
+            with open(path, "w") as f:
+                f.write(ws.recv())
+            logging.info("Recorded '%s' (%d bytes)", path, os.path.getsize(path))
+    finally:
+        ws.close()
+
+
+def measure(func, payloads, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for payload in payloads:
+            func(payload)
+    return time.perf_counter() - start
+
+
+def run(paths, repeat):
+    frames = []
+    for path in paths:
+        with open(path, "rb") as f:
+            frames.append(f.read())
+    total_mb = sum(len(f) for f in frames) * repeat / 1024 / 1024
+    logging.info("Payloads: %d, total size: %.2f MB x %d", len(frames), total_mb / repeat, repeat)
+
+    for codec in available_codecs():
+        objects = [codec.decode(f) for f in frames]
+        decode = measure(codec.decode, frames, repeat)
+        encode = measure(codec.encode, objects, repeat)
+        logging.info(
+            "%-8s decode: %8.3f s (%8.2f MB/s)  encode: %8.3f s (%8.2f MB/s)",
+            codec.name, decode, total_mb / decode, encode, total_mb / encode
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest="command")
+    record_cmd = commands.add_parser("record", help="save responses of heavy RPC calls to files")
+    record_cmd.add_argument("address", help="node rpc endpoint, e.g. localhost:8091")
+    record_cmd.add_argument("directory", help="directory to store payloads")
+    record_cmd.add_argument("--block", type=int, default=1, help="block number for get_ops_in_block/get_block")
+    run_cmd = commands.add_parser("run", help="benchmark codecs on recorded payloads")
+    run_cmd.add_argument("paths", nargs="+", help="files with recorded response frames")
+    run_cmd.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(args.address, args.directory, args.block)
+    elif args.command == "run":
+        run(args.paths, args.repeat)
+    else:
+        parser.print_help()
@@ -0,0 +1,110 @@
+"""
+Benchmarks client stack against in-process fake node, without docker and scorumd.
+
+    python tests/manual/bench_rpc_client.py --latency 0.002 --payload-size 1024 --requests 2000
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+import scorum.graphenebase.operations_fabric as operations
+from scorum.graphenebase.amount import Amount
+
+from automation.account import Account
+from automation.async_rpc_client import AsyncRpcClient
+from automation.connection_pool import ConnectionPool
+from automation.fake_node import FakeNode
+from automation.wallet import Wallet
+
+ACCOUNTS = ["alice", "bob"]
+
+
+def report(name, count, elapsed):
+    logging.info("%-40s %8d in %7.3f s, %10.1f per second", name, count, elapsed, count / elapsed)
+
+
+def bench_connections(node, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        with Wallet(node.chain_id, node.rpc_endpoint) as w:
+            w.login("", "")
+            w.get_api_by_name('database_api')
+            w.get_api_by_name('network_broadcast_api')
+    report("connect + warm-up", count, time.perf_counter() - start)
+
+    pool = ConnectionPool()
+    start = time.perf_counter()
+    for _ in range(count):
+        with Wallet(node.chain_id, node.rpc_endpoint, pool=pool):
+            pass
+    report("pooled connect", count, time.perf_counter() - start)
+    pool.clear()
+
+
+def bench_requests(node, count):
+    with Wallet(node.chain_id, node.rpc_endpoint) as w:
+        start = time.perf_counter()
+        for _ in range(count):
+            w.get_accounts(ACCOUNTS)
+        report("sequential get_accounts", count, time.perf_counter() - start)
+
+    async def pipelined():
+        rpc = AsyncRpcClient(coalesce=False)  # otherwise identical requests are sent to node once
+        await rpc.open_ws(node.rpc_endpoint)
+        body = Wallet.json_rpc_body('get_accounts', ACCOUNTS)
+        await asyncio.gather(*[rpc.send(body) for _ in range(count)])
+        await rpc.close_ws()
+
+    loop = asyncio.new_event_loop()
+    start = time.perf_counter()
+    loop.run_until_complete(pipelined())
+    report("pipelined get_accounts, not coalesced", count, time.perf_counter() - start)
+    loop.close()
+
+
+def bench_serialization(count):
+    start = time.perf_counter()
+    for i in range(count):
+        Wallet.json_rpc_body('get_accounts', ACCOUNTS * 50, _id=i)
+    report("json_rpc_body", count, time.perf_counter() - start)
+
+
+def bench_broadcast(node, count):
+    with Wallet(node.chain_id, node.rpc_endpoint, [Account(name) for name in ACCOUNTS]) as w:
+        start = time.perf_counter()
+        for i in range(count):  # distinct memos, identical transactions signed within a second have the same id
+            w.transfer("alice", "bob", Amount("0.000000001 SCR"), memo=str(i))
+        report("signed transfers", count, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        futures = [
+            w.broadcast_transaction(
+                [operations.transfer_operation("alice", "bob", Amount("0.000000001 SCR"), str(i))],
+                [w.account("alice").get_active_private()]
+            ) for i in range(count)
+        ]
+        for f in futures:
+            f.result()
+        report("signed transfers without waiting", count, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("websockets").setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0, help="seconds node spends on each request")
+    parser.add_argument("--payload-size", type=int, default=0, help="size of filler in node responses")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--transactions", type=int, default=20)
+    parser.add_argument("--block-interval", type=float, default=0.05)
+    args = parser.parse_args()
+
+    with FakeNode(ACCOUNTS, latency=args.latency, payload_size=args.payload_size,
+                  block_interval=args.block_interval) as fake_node:
+        bench_connections(fake_node, args.connections)
+        bench_serialization(args.requests)
+        bench_requests(fake_node, args.requests)
+        bench_broadcast(fake_node, args.transactions)
@@ -1,3 +1,4 @@
+import argparse
 import csv
 import json
 import logging
@@ -6,6 +7,9 @@ from copy import deepcopy
 
 from sortedcontainers import SortedSet
 
+from automation.cassette import recording, replaying
+from automation.connection_pool import POOL
+from automation.rpc_client import RpcClient
 from automation.wallet import Wallet
 from scorum.utils.time import to_date
 from scorum.graphenebase.amount import Amount
@@ -13,14 +17,22 @@ from scorum.graphenebase.amount import Amount
 # CHAIN_ID = "d3c1f19a4947c296446583f988c43fd1a83818fabaf3454a0020198cb361ebd2"  # testnet
 CHAIN_ID = "db4007d45f04c1403a7e66a5c66b5b1cdfc2dde8b5335d1d2f116d592ca3dbb1"  # mainnet
 
+TRANSPORT = None  # set from command line to record node traffic or to replay it without nodes
+
+
+def connect(address):
+    if TRANSPORT:
+        return Wallet(CHAIN_ID, address, rpc=RpcClient(transport=TRANSPORT))
+    return Wallet(CHAIN_ID, address, pool=POOL)
+
 
 def get_chain_capital(address):
-    with Wallet(CHAIN_ID, address) as wallet:
+    with connect(address) as wallet:
         return wallet.get_chain_capital()
 
 
 def get_dynamic_global_properties(address):
-    with Wallet(CHAIN_ID, address) as wallet:
+    with connect(address) as wallet:
         return wallet.get_dynamic_global_properties()
 
 
@@ -40,27 +52,22 @@ def get_total_net_rhsres(posts_to_be_rewarded, all_posts):
     return total_net_rshares
 
 
-def list_all_accounts(address):
-    with Wallet(CHAIN_ID, address) as wallet:
-        return wallet.list_all_accounts()
-
-
-def get_accounts(names, address):
-    with Wallet(CHAIN_ID, address) as wallet:
-        accounts = wallet.get_accounts(names)
+def get_accounts(address, names=None):
+    with connect(address) as wallet:
+        accounts = {a["name"]: a for a in wallet.iter_accounts(names)}
         logging.info("Total number of accounts; %d" % len(accounts))
-        return {a["name"]: a for a in accounts}
+        return accounts
 
 
 def get_posts(address):
-    with Wallet(CHAIN_ID, address) as wallet:
+    with connect(address) as wallet:
         posts = {"%s:%s" % (p["author"], p["permlink"]): p for p in wallet.get_posts_and_comments()}
         logging.info("Total number of posts and comments: %d", len(posts))
         return posts
 
 
 def get_operations_in_block(address, num):
-    with Wallet(CHAIN_ID, address) as w:
+    with connect(address) as w:
         operations = w.get_ops_in_block(num, 2)
         save_to_file("all_operations.json", operations)
         return operations
@@ -473,8 +480,8 @@ def write_accounts_stats(accounts, authors_payouts, fifa_pool):
 
 
 def main(addr_before, addr_after, fifa_block):
-    names = list_all_accounts(addr_before)
-    accounts_before = get_accounts(names, addr_before)
+    accounts_before = get_accounts(addr_before)
+    names = list(accounts_before)
     posts_before = get_posts(addr_before)
     posts_to_be_rewarded = find_posts_to_be_rewarded(posts_before)
     cashout_posts = find_cashout_posts(posts_before)
@@ -486,7 +493,7 @@ def main(addr_before, addr_after, fifa_block):
     logging.info("Collecting data after fifa payment.")
     ops = get_operations_in_block(addr_after, fifa_block)
     fifa_operations, additional_ops = get_fifa_operations(ops, cashout_posts)
-    accounts_after = get_accounts(names, addr_after)
+    accounts_after = get_accounts(addr_after, names)
     calc_accounts_actual_rewards(accounts_after, fifa_operations)
     save_to_file("accounts_after.json", accounts_after)
     posts_after = get_posts(addr_after)
@@ -520,5 +527,14 @@ if __name__ == "__main__":
         format="%(asctime)s.%(msecs)03d (%(name)s) %(levelname)s - %(message)s"
     )
 
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", metavar="CASSETTE", help="record node traffic to file")
+    parser.add_argument("--replay", metavar="CASSETTE", help="replay recorded traffic instead of using nodes")
+    args = parser.parse_args()
+    if args.record:
+        TRANSPORT = recording(args.record)
+    elif args.replay:
+        TRANSPORT = replaying(args.replay)
+
     logging.info("Collecting data before fifa payment.")
     main(addr_before="localhost:8091", addr_after="localhost:8093", fifa_block=3902818)